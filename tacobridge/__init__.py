@@ -5,7 +5,7 @@ providing format conversion and filtered export capabilities.
 """
 
 from tacobridge.api import export, folder2zip, zip2folder
-from tacobridge.execute import execute
+from tacobridge.execute import execute, execute_batch
 from tacobridge.finalize import finalize
 from tacobridge.plan import plan_export, plan_folder2zip, plan_zip2folder
 
@@ -32,5 +32,6 @@ __all__ = [
     "plan_folder2zip",
     "plan_zip2folder",
     "execute",
+    "execute_batch",
     "finalize",
 ]
@@ -4,6 +4,8 @@ Re-exports from tacoreader and tacotoolbox where appropriate.
 Bridge-specific constants (column groups, templates) defined here.
 """
 
+from typing import Any
+
 from tacoreader._constants import (
     COLUMN_ID,
     COLUMN_TYPE,
@@ -57,6 +59,13 @@ __all__ = [
     "SUBSET_OF_KEY",
     "SUBSET_DATE_KEY",
     "VSI_SUBFILE_PREFIX",
+    "EXECUTE_BATCH_SIZE",
+    "COPY_CHUNK_SIZE",
+    "LEVEL_PARQUET_OPTIONS",
+    "RANGE_COALESCE_GAP",
+    "RANGE_COALESCE_MAX_BYTES",
+    "REMOTE_CONCURRENT_RANGES",
+    "REMOTE_STORE_CACHE_SIZE",
 ]
 
 
@@ -95,3 +104,35 @@ SUBSET_DATE_KEY = "taco:subset_date"
 
 VSI_SUBFILE_PREFIX = "/vsisubfile/"
 """GDAL VSI prefix for byte-range access within archives."""
+
+EXECUTE_BATCH_SIZE = 64
+"""Maximum CopyTasks per thread-pool submission when executing with workers > 1."""
+
+COPY_CHUNK_SIZE = 1024 * 1024
+"""Buffer size in bytes for streamed file copies."""
+
+RANGE_COALESCE_GAP = 64 * 1024
+"""Largest gap in bytes between two remote ranges that are still fetched in one request."""
+
+RANGE_COALESCE_MAX_BYTES = 16 * 1024 * 1024
+"""Upper bound on a coalesced remote read; a single larger range is still read whole."""
+
+REMOTE_CONCURRENT_RANGES = 8
+"""Most coalesced runs of one remote source fetched concurrently by a single worker."""
+
+REMOTE_STORE_CACHE_SIZE = 64
+"""Number of remote stores (each with its own connection pool) kept alive for reuse."""
+
+LEVEL_PARQUET_OPTIONS: dict[str, Any] = {
+    "compression_level": 1,
+    "write_batch_size": 8192,
+}
+"""Overrides for levelX.parquet on top of tacotoolbox's CDC defaults.
+
+Keeps content-defined chunking and the row group size, but uses zstd
+level 1: metadata writes are encoder-bound, and level 1 is the fastest
+setting at a small cost in file size. __meta__ files need no overrides;
+pyarrow already writes them with zstd level 1 as a single row group.
+ZipWriter applies the same options to both kinds of file, so ZIP output
+passes them too.
+"""
@@ -4,6 +4,7 @@ Handles reindexing, stripping format-specific columns, and building
 local metadata structures for export operations.
 """
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -11,7 +12,9 @@ import pyarrow as pa
 import pyarrow.compute as pc
 
 from tacobridge._constants import (
+    COLUMN_ID,
     COLUMN_TYPE,
+    CONCAT_COLUMNS,
     EXPORT_STRIP_COLUMNS,
     FOLDER_DATA_DIR,
     METADATA_CURRENT_ID,
@@ -28,6 +31,12 @@ from tacobridge._constants import (
 if TYPE_CHECKING:
     from tacoreader import TacoDataset
 
+_PARENT_MAP_VIEW = "__tacobridge_parent_map"
+"""Arrow table registered on the dataset connection while reindexing a level."""
+
+_PARENTS_VIEW = "__tacobridge_parents"
+"""Arrow table of folder keys registered on the dataset connection while fetching their children."""
+
 
 def get_source_key(row: dict[str, Any], has_source_path: bool, has_source_file: bool) -> str:
     """Extract source key from row for composite keying in concat datasets.
@@ -49,53 +58,139 @@ def strip_columns(table: pa.Table, columns: tuple[str, ...] | None = None) -> pa
         columns: Columns to remove. Defaults to EXPORT_STRIP_COLUMNS.
 
     Returns:
-        Table with columns removed.
+        Table with columns removed (the same table if none are present).
     """
     if columns is None:
         columns = EXPORT_STRIP_COLUMNS
 
-    for col in columns:
-        if col in table.schema.names:
-            table = table.drop([col])
-    return table
+    names = set(table.schema.names)
+    to_drop = [col for col in dict.fromkeys(columns) if col in names]
+    if not to_drop:
+        return table
+    return table.drop_columns(to_drop)
+
 
+def strip_zip_columns(dataset: "TacoDataset", level0_snapshot: pa.Table | None = None) -> list[pa.Table]:
+    """Get all levels from dataset with format-specific columns removed.
 
-def strip_zip_columns(dataset: "TacoDataset") -> list[pa.Table]:
-    """Get all levels from dataset with format-specific columns removed."""
+    Columns are dropped in the SELECT, so DuckDB never decodes or hands
+    them to Arrow.
+
+    Args:
+        dataset: Source TacoDataset
+        level0_snapshot: Already fetched level0 table to reuse instead of
+            querying level0 again
+    """
     levels: list[pa.Table] = []
     max_depth: int = dataset.pit_schema.max_depth()
 
     for level_idx in range(max_depth + 1):
+        if level_idx == 0 and level0_snapshot is not None:
+            levels.append(strip_columns(level0_snapshot))
+            continue
         view_name = f"level{level_idx}"
-        table: pa.Table = dataset._duckdb.execute(f"SELECT * FROM {view_name}").fetch_arrow_table()
-        table = strip_columns(table)
-        levels.append(table)
+        kept = [c for c in view_columns(dataset, view_name) if c not in EXPORT_STRIP_COLUMNS]
+        query = f"SELECT {', '.join(quote_identifier(c) for c in kept)} FROM {view_name}"
+        levels.append(strip_columns(dataset._duckdb.execute(query).fetch_arrow_table()))
 
     return levels
 
 
+def view_columns(dataset: "TacoDataset", view_name: str) -> list[str]:
+    """List column names of a DuckDB view without scanning it."""
+    return [row[0] for row in dataset._duckdb.execute(f"DESCRIBE {view_name}").fetchall()]
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a column name for DuckDB SQL (names contain ':')."""
+    escaped = name.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def source_key_array(table: pa.Table) -> pa.Array:
+    """Columnar equivalent of get_source_key over every row of a table.
+
+    Returns empty strings for single-source datasets.
+    """
+    keys: pa.Array = pa.nulls(table.num_rows, type=pa.string())
+    for column in (METADATA_SOURCE_FILE, METADATA_SOURCE_PATH):
+        if column in table.schema.names:
+            values = pc.cast(table.column(column), pa.string())
+            keys = pc.if_else(pc.fill_null(pc.not_equal(values, ""), False), values, keys)
+    return pc.fill_null(keys, "")
+
+
+def _source_key_sql(columns: list[str], alias: str) -> str:
+    """SQL equivalent of get_source_key for the columns present in a view."""
+    candidates = [
+        f"NULLIF(CAST({alias}.{quote_identifier(column)} AS VARCHAR), '')"
+        for column in (METADATA_SOURCE_PATH, METADATA_SOURCE_FILE)
+        if column in columns
+    ]
+    candidates.append("''")
+    return f"COALESCE({', '.join(candidates)})"
+
+
+def fetch_children(dataset: "TacoDataset", view_name: str, folders: pa.Table) -> pa.Table:
+    """Fetch the children of every row in folders from a level view, in one query.
+
+    Children are matched on parent_id and, for concatenated datasets, on the
+    same source key as their parent, mirroring a per-folder lookup without
+    one query per folder.
+
+    Args:
+        dataset: Source TacoDataset
+        view_name: Level view holding the children
+        folders: Parent rows (needs current_id, plus provenance columns if any)
+
+    Returns:
+        Matching rows of view_name, all columns, in no particular order
+    """
+    columns = view_columns(dataset, view_name)
+    join_on = f"p.current_id = c.{quote_identifier(METADATA_PARENT_ID)}"
+    parent_columns = {"current_id": pc.cast(folders.column(METADATA_CURRENT_ID), pa.int64())}
+    if any(c in columns for c in CONCAT_COLUMNS):
+        join_on += f" AND p.source_key = {_source_key_sql(columns, 'c')}"
+        parent_columns["source_key"] = source_key_array(folders)
+
+    parents = pa.table(parent_columns)
+    query = f"SELECT c.* FROM {view_name} c SEMI JOIN {_PARENTS_VIEW} p ON {join_on}"
+
+    dataset._duckdb.register(_PARENTS_VIEW, parents)
+    try:
+        return dataset._duckdb.execute(query).fetch_arrow_table()
+    finally:
+        dataset._duckdb.unregister(_PARENTS_VIEW)
+
+
 def reindex_table(
     table: pa.Table,
-    new_current_ids: list[int] | range,
-    new_parent_ids: list[int] | range,
+    new_current_ids: Sequence[int] | pa.Array | pa.ChunkedArray,
+    new_parent_ids: Sequence[int] | pa.Array | pa.ChunkedArray,
 ) -> pa.Table:
-    """Replace current_id and parent_id columns with new sequential values."""
+    """Replace current_id and parent_id columns with new sequential values.
+
+    Ids may be Python sequences or Arrow arrays; ranges and Arrow arrays
+    become int64 columns without going through Python ints.
+    """
     current_idx = table.schema.get_field_index(METADATA_CURRENT_ID)
     parent_idx = table.schema.get_field_index(METADATA_PARENT_ID)
 
-    table = table.set_column(
-        current_idx,
-        METADATA_CURRENT_ID,
-        pa.array(list(new_current_ids), type=pa.int64()),
-    )
-    table = table.set_column(
-        parent_idx,
-        METADATA_PARENT_ID,
-        pa.array(list(new_parent_ids), type=pa.int64()),
-    )
+    table = table.set_column(current_idx, METADATA_CURRENT_ID, _int64_ids(new_current_ids))
+    table = table.set_column(parent_idx, METADATA_PARENT_ID, _int64_ids(new_parent_ids))
     return table
 
 
+def _int64_ids(ids: Sequence[int] | pa.Array | pa.ChunkedArray) -> pa.Array | pa.ChunkedArray:
+    """Convert ids to an int64 Arrow array, building ranges as a cumulative sum."""
+    if isinstance(ids, pa.Array | pa.ChunkedArray):
+        return pc.cast(ids, pa.int64())
+    if isinstance(ids, range) and len(ids) > 0:
+        steps = pa.repeat(pa.scalar(ids.step, type=pa.int64()), len(ids))
+        return pc.add(pc.cumulative_sum(steps), ids.start - ids.step)
+    return pa.array(ids, type=pa.int64())
+
+
 def reindex_metadata_from_snapshot(
     dataset: "TacoDataset",
     level0_snapshot: pa.Table,
@@ -108,6 +203,12 @@ def reindex_metadata_from_snapshot(
     Uses _filtered_level_views when available (from cascade filter operations)
     to ensure exported metadata matches the filtered dataset structure.
 
+    Level 0 is reindexed in Arrow. Each deeper level is reindexed by a single
+    DuckDB query that joins against the previous level's id mapping, drops
+    orphaned rows, assigns new ids and strips export columns, so no row
+    crosses into Python until it is final. Children come out grouped by
+    their new parent, in source current_id order.
+
     Args:
         dataset: Source TacoDataset for accessing deeper levels
         level0_snapshot: Pre-fetched level0 table (avoids RANDOM() re-evaluation)
@@ -116,59 +217,77 @@ def reindex_metadata_from_snapshot(
         Tuple of (levels list, local_metadata dict)
     """
     levels: list[pa.Table] = []
-    parent_id_mapping: dict[tuple[str, int], int] = {}
     max_depth: int = dataset.pit_schema.max_depth()
 
-    has_source_path = METADATA_SOURCE_PATH in level0_snapshot.schema.names
-    has_source_file = METADATA_SOURCE_FILE in level0_snapshot.schema.names
-
     filtered_level_views: dict[int, str] = getattr(dataset, "_filtered_level_views", {})
 
-    for level_idx in range(max_depth + 1):
-        if level_idx == 0:
-            rows: list[dict[str, Any]] = level0_snapshot.to_pylist()
-
-            for new_idx, row in enumerate(rows):
-                source_key = get_source_key(row, has_source_path, has_source_file)
-                old_id = int(row[METADATA_CURRENT_ID])
-                parent_id_mapping[(source_key, old_id)] = new_idx
-
-            table = level0_snapshot
-            table = reindex_table(table, range(table.num_rows), range(table.num_rows))
-        else:
-            view_name = filtered_level_views.get(level_idx, f"level{level_idx}")
-            table = dataset._duckdb.execute(f"SELECT * FROM {view_name}").fetch_arrow_table()
-            rows = table.to_pylist()
-
-            filtered_rows: list[dict[str, Any]] = []
-            new_parent_ids: list[int] = []
-
-            for row in rows:
-                source_key = get_source_key(row, has_source_path, has_source_file)
-                old_parent_id = int(row[METADATA_PARENT_ID])
-                key = (source_key, old_parent_id)
-
-                if key in parent_id_mapping:
-                    filtered_rows.append(row)
-                    new_parent_ids.append(parent_id_mapping[key])
+    table = level0_snapshot
+    parent_map = pa.table(
+        {
+            "source_key": source_key_array(table),
+            "old_id": pc.cast(table.column(METADATA_CURRENT_ID), pa.int64()),
+            "new_id": pa.array(range(table.num_rows), type=pa.int64()),
+        }
+    )
+    table = reindex_table(table, range(table.num_rows), range(table.num_rows))
+    levels.append(strip_columns(table))
+
+    for level_idx in range(1, max_depth + 1):
+        view_name = filtered_level_views.get(level_idx, f"level{level_idx}")
+        query = _reindex_level_query(view_name, view_columns(dataset, view_name))
+
+        dataset._duckdb.register(_PARENT_MAP_VIEW, parent_map)
+        try:
+            table = dataset._duckdb.execute(query).fetch_arrow_table()
+        finally:
+            dataset._duckdb.unregister(_PARENT_MAP_VIEW)
+
+        parent_map = pa.table(
+            {
+                "source_key": table.column("__source_key"),
+                "old_id": table.column("__old_id"),
+                "new_id": table.column(METADATA_CURRENT_ID),
+            }
+        )
+        levels.append(table.drop(["__source_key", "__old_id"]))
 
-            for new_idx, row in enumerate(filtered_rows):
-                source_key = get_source_key(row, has_source_path, has_source_file)
-                old_id = int(row[METADATA_CURRENT_ID])
-                parent_id_mapping[(source_key, old_id)] = new_idx
+    local_metadata = build_local_metadata(levels)
+    return levels, local_metadata
 
-            if filtered_rows:
-                table = pa.Table.from_pylist(filtered_rows, schema=table.schema)
-            else:
-                table = table.slice(0, 0)
 
-            table = reindex_table(table, range(table.num_rows), new_parent_ids)
+def _reindex_level_query(view_name: str, columns: list[str]) -> str:
+    """Build the reindex query for one level1+ view.
 
-        table = strip_columns(table)
-        levels.append(table)
+    Surviving rows are ordered by their new parent id, then by their old
+    current_id within a parent, and numbered sequentially in that order.
+    Scan order of concatenated (UNION) views is not stable, so it is never
+    relied on. __source_key and __old_id are carried out so the caller can
+    build the mapping for the next level.
 
-    local_metadata = build_local_metadata(levels)
-    return levels, local_metadata
+    Single-source views have no provenance columns, so the join is on the
+    integer id alone and DuckDB can use its integer (perfect) hash join.
+    """
+    current_id = quote_identifier(METADATA_CURRENT_ID)
+    parent_id = quote_identifier(METADATA_PARENT_ID)
+    excluded = ", ".join(quote_identifier(c) for c in EXPORT_STRIP_COLUMNS if c in columns)
+    exclude_clause = f"EXCLUDE ({excluded}) " if excluded else ""
+    source_key = _source_key_sql(columns, "c")
+    join_on = f"pm.old_id = c.{parent_id}"
+    if any(c in columns for c in CONCAT_COLUMNS):
+        join_on += f" AND pm.source_key = {source_key}"
+
+    return f"""
+        SELECT
+            c.* {exclude_clause}REPLACE (
+                row_number() OVER (ORDER BY pm.new_id, c.{current_id}) - 1 AS {current_id},
+                pm.new_id AS {parent_id}
+            ),
+            {source_key} AS __source_key,
+            CAST(c.{current_id} AS BIGINT) AS __old_id
+        FROM {view_name} c
+        JOIN {_PARENT_MAP_VIEW} pm ON {join_on}
+        ORDER BY pm.new_id, c.{current_id}
+    """
 
 
 def build_local_metadata(levels: list[pa.Table]) -> dict[str, pa.Table]:
@@ -193,38 +312,70 @@ def build_local_metadata(levels: list[pa.Table]) -> dict[str, pa.Table]:
         current_level = levels[level_idx]
         next_level = levels[level_idx + 1]
 
-        next_level_rows: list[dict[str, Any]] = next_level.to_pylist()
-        next_parent_ids = [int(r[METADATA_PARENT_ID]) for r in next_level_rows]
+        if METADATA_RELATIVE_PATH in next_level.schema.names:
+            next_level = next_level.drop([METADATA_RELATIVE_PATH])
+        children_by_parent = _slice_children_by_parent(next_level)
 
-        folders_mask = pc.equal(current_level.column(COLUMN_TYPE), pa.scalar(SAMPLE_TYPE_FOLDER))
-        folders: pa.Table = current_level.filter(folders_mask)
+        folders: pa.Table = current_level.filter(folder_mask(current_level.column(COLUMN_TYPE)))
+        folder_ids = folders.column(COLUMN_ID).to_pylist()
+        current_ids = folders.column(METADATA_CURRENT_ID).to_pylist()
+        parent_ids = folders.column(METADATA_PARENT_ID).to_pylist()
 
-        for folder in folders.to_pylist():
-            current_id = int(folder[METADATA_CURRENT_ID])
-            parent_id = int(folder[METADATA_PARENT_ID])
+        level_paths = paths_by_level[level_idx]
+        parent_paths = paths_by_level[level_idx - 1] if level_idx > 0 else None
+        no_children = next_level.slice(0, 0)
 
-            if level_idx == 0:
-                rel_path = folder["id"]
+        for folder_id, current_id, parent_id in zip(folder_ids, current_ids, parent_ids, strict=True):
+            if parent_paths is None:
+                rel_path = folder_id
             else:
-                parent_path = paths_by_level[level_idx - 1].get(parent_id, "")
-                rel_path = f"{parent_path}/{folder['id']}" if parent_path else folder["id"]
+                parent_path = parent_paths.get(parent_id, "")
+                rel_path = f"{parent_path}/{folder_id}" if parent_path else folder_id
 
-            paths_by_level[level_idx][current_id] = rel_path
-            folder_path = f"{FOLDER_DATA_DIR}/{rel_path}/"
+            level_paths[current_id] = rel_path
 
-            children_indices = [i for i, pid in enumerate(next_parent_ids) if pid == current_id]
+            local_metadata[f"{FOLDER_DATA_DIR}/{rel_path}/"] = children_by_parent.get(current_id, no_children)
 
-            if children_indices:
-                children: pa.Table = next_level.take(children_indices)
-            else:
-                children = next_level.slice(0, 0)
+    return local_metadata
 
-            if METADATA_RELATIVE_PATH in children.schema.names:
-                children = children.drop([METADATA_RELATIVE_PATH])
 
-            local_metadata[folder_path] = children
+def folder_mask(types: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Boolean mask of rows whose type is SAMPLE_TYPE_FOLDER.
 
-    return local_metadata
+    Dictionary-encoded chunks (e.g. from parquet read with read_dictionary)
+    compare the few dictionary values once and gather by index instead of
+    comparing every string.
+    """
+    chunks = []
+    for chunk in types.chunks:
+        if isinstance(chunk, pa.DictionaryArray):
+            is_folder = pc.equal(chunk.dictionary, SAMPLE_TYPE_FOLDER)
+            chunks.append(is_folder.take(chunk.indices))
+        else:
+            chunks.append(pc.equal(chunk, SAMPLE_TYPE_FOLDER))
+    return pa.chunked_array(chunks, type=pa.bool_())
+
+
+def _slice_children_by_parent(table: pa.Table) -> dict[int, pa.Table]:
+    """Map each parent_id to a slice of its children, in table order.
+
+    Rows are stably sorted by parent once, which is skipped for exported
+    levels since they are already ordered by parent. Each parent's children
+    are then one contiguous zero-copy slice instead of a gather per folder.
+    """
+    parents = table.column(METADATA_PARENT_ID).combine_chunks()
+    if len(parents) > 1 and pc.min(pc.pairwise_diff(parents)).as_py() < 0:
+        order = pc.sort_indices(parents)
+        table = table.take(order)
+        parents = parents.take(order)
+
+    runs = pc.run_end_encode(parents)
+    ends = runs.run_ends.to_pylist()
+    starts = [0, *ends][:-1]
+    return {
+        int(pid): table.slice(start, end - start)
+        for pid, start, end in zip(runs.values.to_pylist(), starts, ends, strict=True)
+    }
 
 
 def prepare_collection(dataset: "TacoDataset") -> dict[str, Any]:
@@ -234,7 +385,10 @@ def prepare_collection(dataset: "TacoDataset") -> dict[str, Any]:
     the export timestamp.
     """
     collection: dict[str, Any] = dataset.collection.copy()
-    collection[PIT_SCHEMA_KEY]["root"]["n"] = dataset.pit_schema.root["n"]
+    # Copy the nested dicts being updated; they are shared with the source dataset
+    pit_schema: dict[str, Any] = dict(collection[PIT_SCHEMA_KEY])
+    pit_schema["root"] = {**pit_schema["root"], "n": dataset.pit_schema.root["n"]}
+    collection[PIT_SCHEMA_KEY] = pit_schema
     collection[SUBSET_OF_KEY] = collection.get("id", "unknown")
     collection[SUBSET_DATE_KEY] = datetime.now(UTC).isoformat()
     return collection
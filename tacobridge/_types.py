@@ -4,6 +4,7 @@ Three operation types with different semantics:
 
     ExportPlan / Zip2FolderPlan:
         - CopyTask: transfer bytes from src → dest (local or remote)
+        - CopyTaskArray: columnar storage for many CopyTasks
         - execute() performs actual I/O
         - finalize() writes metadata
 
@@ -11,17 +12,28 @@ Three operation types with different semantics:
         - ZipEntry: reference to existing local file → arc path in ZIP
         - NO execute() needed (files already exist)
         - finalize() packages everything into ZIP
+
+Tasks, entries and plans are frozen dataclasses: assigning a field raises
+dataclasses.FrozenInstanceError; use dataclasses.replace() to derive one.
 """
 
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, overload
 
 import pyarrow as pa
-from pydantic import BaseModel
+import pyarrow.compute as pc
+
+_ITER_BATCH_ROWS = 8192
+"""Rows converted to CopyTask objects at a time when iterating a CopyTaskArray."""
 
 # --- Task Types ---
 
 
-class CopyTask(BaseModel, frozen=True):
+@dataclass(frozen=True, slots=True)
+class CopyTask:
     """Single byte-transfer operation (for export/zip2folder).
 
     Represents copying bytes from a source (local file or remote URL)
@@ -40,7 +52,8 @@ class CopyTask(BaseModel, frozen=True):
     size: int | None = None
 
 
-class ZipEntry(BaseModel, frozen=True):
+@dataclass(frozen=True, slots=True)
+class ZipEntry:
     """Reference to file for ZIP packaging (for folder2zip).
 
     NOT a copy operation - the file already exists locally.
@@ -55,16 +68,117 @@ class ZipEntry(BaseModel, frozen=True):
     arc_path: str
 
 
+class CopyTaskArray(Sequence[CopyTask]):
+    """Columnar (struct-of-arrays) collection of CopyTasks.
+
+    Stores src, dest, offset and size as columns of one Arrow table instead
+    of one Python object per task. Behaves as a read-only sequence: indexing
+    and iteration build CopyTask objects on demand, slicing is zero-copy.
+
+    Attributes:
+        table: Arrow table with TASK_SCHEMA columns (null offset/size = full file)
+    """
+
+    __slots__ = ("table",)
+
+    TASK_SCHEMA = pa.schema(
+        [
+            ("src", pa.string()),
+            ("dest", pa.string()),
+            ("offset", pa.int64()),
+            ("size", pa.int64()),
+        ]
+    )
+
+    def __init__(self, table: pa.Table) -> None:
+        self.table: pa.Table = table
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[CopyTask]) -> "CopyTaskArray":
+        """Build from CopyTask objects."""
+        tasks = list(tasks)
+        return cls(
+            pa.table(
+                {
+                    "src": [t.src for t in tasks],
+                    "dest": [t.dest for t in tasks],
+                    "offset": [t.offset for t in tasks],
+                    "size": [t.size for t in tasks],
+                },
+                schema=cls.TASK_SCHEMA,
+            )
+        )
+
+    def __len__(self) -> int:
+        return int(self.table.num_rows)
+
+    @overload
+    def __getitem__(self, index: int) -> CopyTask: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CopyTaskArray": ...
+
+    def __getitem__(self, index: int | slice) -> "CopyTask | CopyTaskArray":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return CopyTaskArray(self.table.take(list(range(start, stop, step))))
+            return CopyTaskArray(self.table.slice(start, max(0, stop - start)))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CopyTaskArray index out of range")
+        return CopyTask(**self.table.slice(index, 1).to_pylist()[0])
+
+    def __iter__(self) -> Iterator[CopyTask]:
+        for batch in self.table.to_batches(max_chunksize=_ITER_BATCH_ROWS):
+            for row in batch.to_pylist():
+                yield CopyTask(**row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CopyTaskArray):
+            return bool(self.table.equals(other.table))
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CopyTaskArray({len(self)} tasks)"
+
+    def sort_by_source(self) -> "CopyTaskArray":
+        """Order tasks by src, then offset, so ranges of one source are adjacent."""
+        return CopyTaskArray(self.table.sort_by([("src", "ascending"), ("offset", "ascending")]))
+
+    def with_dest_root(self, old_root: Path, new_root: Path) -> "CopyTaskArray":
+        """Rebase every dest from old_root to new_root in one column operation.
+
+        Raises:
+            ValueError: If a dest is not under old_root
+        """
+        dest = self.table.column("dest")
+        # Match a whole path component, so /out/ds does not claim /out/ds2/...
+        prefix = str(old_root).rstrip(os.sep) + os.sep
+        if len(self) and not pc.all(pc.starts_with(dest, prefix)).as_py():
+            raise ValueError(f"Task destinations are not under {old_root}")
+
+        rel = pc.utf8_slice_codeunits(dest, start=len(prefix))
+        new_dest = pc.binary_join_element_wise(str(new_root).rstrip(os.sep), rel, os.sep)
+        return CopyTaskArray(self.table.set_column(1, "dest", new_dest))
+
+
 # --- Plan Types ---
 
 
-class ExportPlan(BaseModel, frozen=True, arbitrary_types_allowed=True):
+@dataclass(frozen=True, slots=True)
+class ExportPlan:
     """Plan for export operation.
 
     Workflow: plan_export() → execute(task) for each → finalize(plan)
 
     Attributes:
-        tasks: Byte-transfer operations to execute
+        tasks: Byte-transfer operations to execute (a CopyTaskArray when planned)
         source: Original dataset path (for provenance)
         output: Output directory path
         levels: Reindexed metadata tables (level0, level1, ...)
@@ -72,21 +186,22 @@ class ExportPlan(BaseModel, frozen=True, arbitrary_types_allowed=True):
         collection: Updated COLLECTION.json dict
     """
 
-    tasks: tuple[CopyTask, ...]
+    tasks: Sequence[CopyTask]
     source: str
     output: Path
     levels: tuple[pa.Table, ...] = ()
-    local_metadata: dict[str, pa.Table] = {}
-    collection: dict = {}
+    local_metadata: dict[str, pa.Table] = field(default_factory=dict)
+    collection: dict[str, Any] = field(default_factory=dict)
 
 
-class Zip2FolderPlan(BaseModel, frozen=True, arbitrary_types_allowed=True):
+@dataclass(frozen=True, slots=True)
+class Zip2FolderPlan:
     """Plan for ZIP to FOLDER conversion.
 
     Workflow: plan_zip2folder() → execute(task) for each → finalize(plan)
 
     Attributes:
-        tasks: Byte-transfer operations to execute
+        tasks: Byte-transfer operations to execute (a CopyTaskArray when planned)
         source: Source .tacozip path
         output: Output directory path
         levels: Metadata tables with ZIP columns stripped
@@ -94,15 +209,16 @@ class Zip2FolderPlan(BaseModel, frozen=True, arbitrary_types_allowed=True):
         collection: Original COLLECTION.json dict
     """
 
-    tasks: tuple[CopyTask, ...]
+    tasks: Sequence[CopyTask]
     source: str
     output: Path
     levels: tuple[pa.Table, ...] = ()
-    local_metadata: dict[str, pa.Table] = {}
-    collection: dict = {}
+    local_metadata: dict[str, pa.Table] = field(default_factory=dict)
+    collection: dict[str, Any] = field(default_factory=dict)
 
 
-class Folder2ZipPlan(BaseModel, frozen=True, arbitrary_types_allowed=True):
+@dataclass(frozen=True, slots=True)
+class Folder2ZipPlan:
     """Plan for FOLDER to ZIP conversion.
 
     Workflow: plan_folder2zip() → finalize(plan)
@@ -121,5 +237,5 @@ class Folder2ZipPlan(BaseModel, frozen=True, arbitrary_types_allowed=True):
     source: Path
     output: Path
     levels: tuple[pa.Table, ...] = ()
-    local_metadata: dict[str, pa.Table] = {}
-    collection: dict = {}
+    local_metadata: dict[str, pa.Table] = field(default_factory=dict)
+    collection: dict[str, Any] = field(default_factory=dict)
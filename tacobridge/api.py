@@ -10,35 +10,37 @@ Format auto-detection (like tacotoolbox.create):
     - anything else -> FOLDER format
 """
 
-import json
 import shutil
+import threading
 import zipfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 import tacoreader
-from tacotoolbox._column_utils import write_parquet_file, write_parquet_file_with_cdc
 from tacotoolbox._metadata import MetadataPackage
 from tacotoolbox._writers.zip_writer import ZipWriter
 from tqdm import tqdm
 
 from tacobridge._constants import (
+    COPY_CHUNK_SIZE,
+    EXECUTE_BATCH_SIZE,
     FIELD_SCHEMA_KEY,
-    FOLDER_COLLECTION_FILENAME,
     FOLDER_DATA_DIR,
     FOLDER_META_FILENAME,
-    FOLDER_METADATA_DIR,
+    LEVEL_PARQUET_OPTIONS,
     PIT_SCHEMA_KEY,
     TACOZIP_EXTENSIONS,
     TEMP_FOLDER_TEMPLATE,
 )
+from tacobridge._exceptions import TacoExecuteError
 from tacobridge._logging import get_logger
 from tacobridge._metadata import build_local_metadata, strip_zip_columns
-from tacobridge._types import CopyTask, ExportPlan
-from tacobridge.execute import execute
-from tacobridge.finalize import finalize
-from tacobridge.plan import plan_export, plan_folder2zip, plan_zip2folder
+from tacobridge._types import CopyTask, CopyTaskArray, ExportPlan
+from tacobridge.execute import execute_batch, make_dest_dirs
+from tacobridge.finalize import finalize, write_folder_metadata, write_local_metadata
+from tacobridge.plan import iter_data_files, plan_export, plan_folder2zip, plan_zip2folder
 
 if TYPE_CHECKING:
     from tacoreader import TacoDataset
@@ -57,6 +59,7 @@ def export(
     """Export TacoDataset to FOLDER or ZIP format.
 
     Dataset can be filtered, concatenated, or transformed before export.
+    ZIP output stores entries uncompressed, as folder2zip() does.
 
     Args:
         dataset: TacoDataset instance (can be filtered, concatenated, etc.)
@@ -83,7 +86,7 @@ def export(
     if final_format == "folder":
         plan = plan_export(dataset, output)
         _execute_tasks(plan.tasks, workers=workers, progress=progress, desc="Exporting")
-        return finalize(plan)
+        return finalize(plan, workers)
 
     plan = plan_export(dataset, output.with_suffix(""))
     return _export_to_zip(plan, output, workers, progress, temp_dir)
@@ -112,11 +115,11 @@ def zip2folder(
     output = Path(output)
 
     if not is_remote(str(source)):
-        return _zip2folder_local(source, output, progress)
+        return _zip2folder_local(source, output, workers, progress)
 
     plan = plan_zip2folder(str(source), output)
     _execute_tasks(plan.tasks, workers=workers, progress=progress, desc="Extracting")
-    return finalize(plan)
+    return finalize(plan, workers)
 
 
 def folder2zip(
@@ -126,6 +129,9 @@ def folder2zip(
 ) -> Path:
     """Convert FOLDER to ZIP format.
 
+    Entries are written STORED (uncompressed) so they stay addressable by
+    byte offset; data files are expected to carry their own compression.
+
     Args:
         source: Path to source folder
         output: Path to output .tacozip
@@ -162,7 +168,7 @@ def _export_to_zip(
     try:
         temp_plan = _relocate_plan(plan, temp_folder)
         _execute_tasks(temp_plan.tasks, workers=workers, progress=progress, desc="Exporting")
-        _write_local_metadata(plan.local_metadata, temp_folder)
+        write_local_metadata(plan.local_metadata, temp_folder, workers)
         return _package_to_zip(temp_folder, output, plan, progress)
     finally:
         if temp_folder.exists():
@@ -178,11 +184,9 @@ def _create_temp_path(output: Path, temp_dir: str | Path | None) -> Path:
 
 def _relocate_plan(plan: ExportPlan, temp_folder: Path) -> ExportPlan:
     """Create new plan with tasks redirected to temp folder."""
+    tasks = plan.tasks if isinstance(plan.tasks, CopyTaskArray) else CopyTaskArray.from_tasks(plan.tasks)
     return ExportPlan(
-        tasks=tuple(
-            task.model_copy(update={"dest": str(temp_folder / Path(task.dest).relative_to(plan.output))})
-            for task in plan.tasks
-        ),
+        tasks=tasks.with_dest_root(plan.output, temp_folder),
         source=plan.source,
         output=temp_folder,
         levels=plan.levels,
@@ -191,25 +195,20 @@ def _relocate_plan(plan: ExportPlan, temp_folder: Path) -> ExportPlan:
     )
 
 
-def _write_local_metadata(local_metadata: dict[str, Any], temp_folder: Path) -> None:
-    """Write __meta__ files to temp folder."""
-    for folder_path, table in local_metadata.items():
-        meta_path = temp_folder / folder_path / FOLDER_META_FILENAME
-        meta_path.parent.mkdir(parents=True, exist_ok=True)
-        write_parquet_file(table, meta_path)
-
-
 def _package_to_zip(temp_folder: Path, output: Path, plan: ExportPlan, progress: bool) -> Path:
-    """Package temp folder contents into ZIP."""
+    """Package temp folder contents into ZIP.
+
+    ZipWriter (via tacozip) writes every entry STORED at offsets precomputed
+    for /vsisubfile/ access, so there is no per-entry compression to spread
+    across workers; packaging is a sequential copy bound by disk throughput.
+    """
     data_dir = temp_folder / FOLDER_DATA_DIR
     src_files: list[str] = []
     arc_files: list[str] = []
 
-    for file_path in data_dir.rglob("*"):
-        if file_path.is_file() and file_path.name != FOLDER_META_FILENAME:
-            rel = file_path.relative_to(data_dir)
-            src_files.append(str(file_path))
-            arc_files.append(f"{FOLDER_DATA_DIR}/{rel}")
+    for src, arc_path in iter_data_files(data_dir):
+        src_files.append(src)
+        arc_files.append(arc_path)
 
     pit_schema: dict[str, Any] = plan.collection[PIT_SCHEMA_KEY]
     field_schema: dict[str, Any] = plan.collection[FIELD_SCHEMA_KEY]
@@ -231,11 +230,12 @@ def _package_to_zip(temp_folder: Path, output: Path, plan: ExportPlan, progress:
         src_files=src_files,
         arc_files=arc_files,
         metadata_package=metadata_package,
+        **LEVEL_PARQUET_OPTIONS,
     )
     return result
 
 
-def _zip2folder_local(source: Path, output: Path, progress: bool) -> Path:
+def _zip2folder_local(source: Path, output: Path, workers: int, progress: bool) -> Path:
     """Fast extraction for local ZIPs using zipfile."""
     dataset: TacoDataset = tacoreader.load(source)
     levels = strip_zip_columns(dataset)
@@ -246,50 +246,127 @@ def _zip2folder_local(source: Path, output: Path, progress: bool) -> Path:
 
     with zipfile.ZipFile(source, "r") as zf:
         data_members = [
-            m for m in zf.namelist() if m.startswith(f"{FOLDER_DATA_DIR}/") and not m.endswith(FOLDER_META_FILENAME)
+            info
+            for info in zf.infolist()
+            if info.filename.startswith(f"{FOLDER_DATA_DIR}/") and not info.filename.endswith(FOLDER_META_FILENAME)
         ]
 
-        members_iter = tqdm(data_members, desc="Extracting", unit="file") if progress else data_members
-        for member in members_iter:
-            zf.extract(member, output)
-
-    metadata_dir = output / FOLDER_METADATA_DIR
-    metadata_dir.mkdir(parents=True, exist_ok=True)
+    # Directory members (possibly empty folders) are recreated, not extracted
+    for info in data_members:
+        if info.is_dir():
+            _member_dest(output, info.filename).mkdir(parents=True, exist_ok=True)
 
-    for i, table in enumerate(levels):
-        write_parquet_file_with_cdc(table, metadata_dir / f"level{i}.parquet")
+    _extract_members(source, [info for info in data_members if not info.is_dir()], output, workers, progress)
 
-    for folder_path, table in local_metadata.items():
-        meta_path = output / folder_path / FOLDER_META_FILENAME
-        meta_path.parent.mkdir(parents=True, exist_ok=True)
-        write_parquet_file(table, meta_path)
-
-    collection_path = output / FOLDER_COLLECTION_FILENAME
-    collection_path.write_text(
-        json.dumps(collection, indent=4, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    write_folder_metadata(output, levels, local_metadata, collection, workers)
 
     logger.info(f"Extracted to FOLDER: {output}")
     return output
 
 
-def _execute_tasks(tasks: tuple[CopyTask, ...], workers: int, progress: bool, desc: str) -> None:
-    """Execute tasks with optional parallelization."""
+def _extract_members(
+    source: Path,
+    members: list[zipfile.ZipInfo],
+    output: Path,
+    workers: int,
+    progress: bool,
+) -> None:
+    """Extract ZIP members under output, in parallel when workers > 1.
+
+    The central directory is read once by the caller. Parent directories are
+    created in a single pass up front, and each worker thread keeps its own
+    ZipFile handle so reads never share a file position. The first failure
+    cancels every extraction that has not started yet.
+    """
+    targets = [(info, _member_dest(output, info.filename)) for info in members]
+    for directory in sorted({dest.parent for _, dest in targets}):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    local = threading.local()
+    handles: list[zipfile.ZipFile] = []
+    handles_lock = threading.Lock()
+
+    def extract_one(target: tuple[zipfile.ZipInfo, Path]) -> None:
+        zf: zipfile.ZipFile | None = getattr(local, "zf", None)
+        if zf is None:
+            zf = zipfile.ZipFile(source, "r")
+            local.zf = zf
+            with handles_lock:
+                handles.append(zf)
+        info, dest = target
+        with zf.open(info) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+    try:
+        with tqdm(total=len(targets), desc="Extracting", unit="file", disable=not progress) as bar:
+            if workers <= 1:
+                for target in targets:
+                    extract_one(target)
+                    bar.update()
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(extract_one, target) for target in targets]
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                            bar.update()
+                    except BaseException:
+                        for future in futures:
+                            future.cancel()
+                        raise
+    finally:
+        for zf in handles:
+            zf.close()
+
+
+def _member_dest(output: Path, name: str) -> Path:
+    """Resolve a member name under output, rejecting paths that escape it."""
+    parts = [part for part in name.split("/") if part not in ("", ".")]
+    if ".." in parts:
+        raise TacoExecuteError(f"Unsafe path in ZIP: {name}")
+    return output.joinpath(*parts)
+
+
+def _execute_tasks(tasks: Sequence[CopyTask], workers: int, progress: bool, desc: str) -> None:
+    """Execute tasks with optional parallelization.
+
+    Tasks run in batches through execute_batch, so each future covers several
+    files and remote ranges of the same source are fetched together. Planned
+    tasks are ordered by source first so those ranges share a batch.
+
+    Batches are sliced lazily and at most workers * 4 are in flight, so the
+    pool's queue never holds the whole task list as CopyTask objects.
+    Destination directories are created once for the whole task list, since
+    siblings of one directory usually span several batches.
+    """
     if not tasks:
         return
 
-    if workers <= 1:
-        task_iter = tqdm(tasks, desc=desc, unit="file") if progress else tasks
-        for task in task_iter:
-            execute(task)
-    else:
+    if isinstance(tasks, CopyTaskArray):
+        tasks = tasks.sort_by_source()
+    make_dest_dirs(tasks)
+
+    max_in_flight = max(workers, 1) * 4
+    batch_size = max(1, min(EXECUTE_BATCH_SIZE, len(tasks) // max_in_flight))
+    batches = (tasks[i : i + batch_size] for i in range(0, len(tasks), batch_size))
+
+    with tqdm(total=len(tasks), desc=desc, unit="file", disable=not progress) as bar:
+        if workers <= 1:
+            for batch in batches:
+                execute_batch(batch, make_parents=False)
+                bar.update(len(batch))
+            return
+
         with ThreadPoolExecutor(max_workers=workers) as pool:
-            futures = [pool.submit(execute, task) for task in tasks]
-            future_iter = (
-                tqdm(as_completed(futures), desc=desc, unit="file", total=len(futures))
-                if progress
-                else as_completed(futures)
-            )
-            for future in future_iter:
+            in_flight: dict[Future[None], int] = {}
+            for batch in batches:
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                        bar.update(in_flight.pop(future))
+                in_flight[pool.submit(execute_batch, batch, make_parents=False)] = len(batch)
+
+            for future in as_completed(in_flight):
                 future.result()
+                bar.update(in_flight[future])
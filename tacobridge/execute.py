@@ -5,13 +5,41 @@ Folder2ZipPlan uses ZipEntry which doesn't need execute() -
 files already exist and are packaged directly by finalize().
 """
 
+import errno
+import functools
+import os
+import re
+import shutil
+from collections.abc import Iterator, Sequence
+from io import BufferedReader
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+from urllib.parse import unquote, urlsplit
 
+import obstore as obs
+import pyarrow.compute as pc
+from obstore.store import from_url
 from tacoreader._format import is_remote
-from tacoreader._remote_io import download_bytes, download_range
 
+from tacobridge._constants import (
+    COPY_CHUNK_SIZE,
+    RANGE_COALESCE_GAP,
+    RANGE_COALESCE_MAX_BYTES,
+    REMOTE_CONCURRENT_RANGES,
+    REMOTE_STORE_CACHE_SIZE,
+)
 from tacobridge._exceptions import TacoExecuteError
-from tacobridge._types import CopyTask
+from tacobridge._types import CopyTask, CopyTaskArray
+
+if TYPE_CHECKING:
+    from obstore import GetOptions
+
+_SEPARATORS = re.escape(os.sep + (os.altsep or ""))
+_BASENAME_PATTERN = f"(^|[{_SEPARATORS}])[^{_SEPARATORS}]*$"
+"""Final path component with its separator; removing it leaves os.path.dirname."""
+
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP})
+"""errno values meaning copy_file_range cannot be used between these files."""
 
 
 def execute(task: CopyTask) -> None:
@@ -31,41 +59,290 @@ def execute(task: CopyTask) -> None:
         >>> with ThreadPoolExecutor(8) as pool:
         ...     list(pool.map(execute, plan.tasks))
     """
+    _copy(task, make_parents=True)
+
+
+def execute_batch(tasks: Sequence[CopyTask], make_parents: bool = True) -> None:
+    """Execute several CopyTasks, grouping byte ranges per source.
+
+    Tasks with offset/size that share a src (entries of one .tacozip) are
+    handled together: a local source is opened once and its ranges copied
+    in offset order; a remote source has adjacent ranges merged into runs,
+    each fetched with one request and split back into files. Whole-file
+    tasks are copied like execute(). Destination directories are created
+    once per batch, not once per task.
+
+    Args:
+        tasks: CopyTasks to execute, ideally sorted by src and offset
+        make_parents: Create destination directories first; pass False when
+            make_dest_dirs() already ran over the whole task list
+
+    Raises:
+        TacoExecuteError: If any read or write fails
+    """
+    if make_parents:
+        make_dest_dirs(tasks)
+
+    local: dict[str, list[tuple[str, int, int]]] = {}
+    remote: dict[str, list[tuple[str, int, int]]] = {}
+    for task in tasks:
+        if task.offset is None or task.size is None:
+            _copy(task, make_parents=False)
+        else:
+            groups = remote if is_remote(task.src) else local
+            groups.setdefault(task.src, []).append((task.dest, task.offset, task.size))
+
+    for src, group in local.items():
+        try:
+            _copy_local_ranges(src, group)
+        except Exception as e:
+            raise TacoExecuteError(f"Failed: {src} -> {len(group)} ranges: {e}") from e
+
+    for src, group in remote.items():
+        runs = _coalesce_ranges(group, RANGE_COALESCE_GAP, RANGE_COALESCE_MAX_BYTES)
+        try:
+            for (start, _, members), data in zip(runs, _read_remote_runs(src, runs), strict=True):
+                for dest, offset, size in members:
+                    _write_bytes(dest, data[offset - start : offset - start + size], make_parents=False)
+        except TacoExecuteError:
+            raise
+        except Exception as e:
+            raise TacoExecuteError(f"Failed: {src} -> {len(group)} ranges: {e}") from e
+
+
+def _copy(task: CopyTask, make_parents: bool) -> None:
+    """Copy one task's bytes, wrapping failures in TacoExecuteError.
+
+    Local sources are copied file to file without passing through Python
+    bytes; remote files and ranges are streamed to disk in chunks.
+    """
     try:
-        data = _read_bytes(task.src, task.offset, task.size)
-        _write_bytes(task.dest, data)
+        if make_parents:
+            Path(task.dest).parent.mkdir(parents=True, exist_ok=True)
+        if is_remote(task.src):
+            _download_to(task.src, task.dest, task.offset, task.size)
+        else:
+            _copy_local(task.src, task.dest, task.offset, task.size)
     except TacoExecuteError:
         raise
     except Exception as e:
         raise TacoExecuteError(f"Failed: {task.src} -> {task.dest}: {e}") from e
 
 
-def _read_bytes(src: str, offset: int | None, size: int | None) -> bytes:
-    """Read bytes from local file or remote URL."""
-    if is_remote(src):
-        return _read_remote(src, offset, size)
-    return _read_local(src, offset, size)
+def make_dest_dirs(tasks: Sequence[CopyTask]) -> None:
+    """Create every destination directory of tasks, each exactly once.
+
+    For a CopyTaskArray, basenames are stripped and directories deduplicated
+    in Arrow, so only the distinct directories become Python strings. Only
+    the deepest directories are passed to makedirs; their ancestors are
+    created along the way instead of costing a call of their own.
+
+    Raises:
+        TacoExecuteError: If a directory cannot be created
+    """
+    if isinstance(tasks, CopyTaskArray):
+        dirnames = pc.replace_substring_regex(tasks.table.column("dest"), _BASENAME_PATTERN, "")
+        directories = set(pc.unique(dirnames).to_pylist()) - {""}
+    else:
+        directories = {os.path.dirname(task.dest) for task in tasks} - {""}
+    ancestors: set[str] = set()
+    for directory in directories:
+        child, parent = directory, os.path.dirname(directory)
+        while parent and parent != child and parent not in ancestors:
+            ancestors.add(parent)
+            child, parent = parent, os.path.dirname(parent)
+    try:
+        for directory in sorted(directories - ancestors):
+            os.makedirs(directory, exist_ok=True)
+    except OSError as e:
+        raise TacoExecuteError(f"Failed to create directory: {e}") from e
+
+
+def _copy_local(src: str, dest: str, offset: int | None, size: int | None) -> None:
+    """Copy a local file, or a byte range of it, using kernel-side copies where possible."""
+    if offset is None and size is None:
+        shutil.copyfile(src, dest)
+        return
+
+    with open(src, "rb") as fsrc:
+        _copy_range(fsrc, dest, offset or 0, size)
+
+
+def _copy_local_ranges(src: str, ranges: list[tuple[str, int, int]]) -> None:
+    """Copy (dest, offset, size) ranges of one local file, opening it once.
+
+    Ranges are copied in offset order so the source is read front to back,
+    and the kernel is told so, which lets readahead run ahead of the copies.
+    """
+    ranges = sorted(ranges, key=lambda r: r[1])
+    with open(src, "rb") as fsrc:
+        if hasattr(os, "posix_fadvise"):
+            start = ranges[0][1]
+            end = max(offset + size for _, offset, size in ranges)
+            os.posix_fadvise(fsrc.fileno(), start, end - start, os.POSIX_FADV_SEQUENTIAL)
+        for dest, offset, size in ranges:
+            _copy_range(fsrc, dest, offset, size)
+
 
+def _copy_range(fsrc: BufferedReader, dest: str, start: int, size: int | None) -> None:
+    """Copy size bytes (or the rest of the file) from start of an open source to dest."""
+    with open(dest, "wb") as fdst:
+        if size is None:
+            size = os.fstat(fsrc.fileno()).st_size - start
+        if not _copy_file_range(fsrc.fileno(), fdst.fileno(), start, size):
+            _copy_buffered(fsrc, fdst, start, size)
 
-def _read_local(src: str, offset: int | None, size: int | None) -> bytes:
-    """Read bytes from local filesystem."""
-    with open(src, "rb") as f:
-        if offset is not None:
-            f.seek(offset)
-        if size is not None:
-            return f.read(size)
-        return f.read()
+
+def _short_copy_error(copied: int, size: int, start: int) -> TacoExecuteError:
+    """Error for a range that ended before size bytes were copied."""
+    return TacoExecuteError(f"Source ended after {copied} of {size} bytes at offset {start}")
+
+
+def _copy_buffered(fsrc: BufferedReader, fdst: BinaryIO, start: int, size: int) -> None:
+    """Copy size bytes from start through one reused buffer.
+
+    Chunks are read into the buffer and written from views of it, so no
+    bytes object is allocated per chunk.
+    """
+    fsrc.seek(start)
+    buf = memoryview(bytearray(min(COPY_CHUNK_SIZE, size)))
+    remaining = size
+    while remaining > 0:
+        n = fsrc.readinto(buf[: min(len(buf), remaining)])
+        if not n:
+            raise _short_copy_error(size - remaining, size, start)
+        fdst.write(buf[:n])
+        remaining -= n
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, size: int) -> bool:
+    """Copy size bytes from offset with os.copy_file_range.
+
+    Returns False, having copied nothing, when the platform or filesystem
+    does not support it so the caller can fall back to a buffered copy.
+    A first call that copies 0 bytes counts as unsupported too: procfs,
+    some FUSE and network filesystems report 0 instead of failing.
+
+    Raises:
+        TacoExecuteError: If the source ends before size bytes are copied
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    copied = 0
+    while copied < size:
+        try:
+            n = os.copy_file_range(src_fd, dst_fd, size - copied, offset + copied)
+        except OSError as e:
+            if copied == 0 and e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                return False
+            raise
+        if n == 0:
+            if copied == 0:
+                return False
+            raise _short_copy_error(copied, size, offset)
+        copied += n
+    return True
+
+
+def _remote_location(src: str) -> tuple[Any, str]:
+    """Resolve a remote URL to a shared store and the path within it.
+
+    Plain HTTP(S) URLs share one store per host, so every file on a host
+    reuses the same pooled keep-alive connections. Other URLs (cloud
+    schemes, signed URLs with a query string) get one store per URL, as do
+    paths with an encoded slash: the store splits paths on "/", so %2F
+    cannot survive decoding into a per-host path.
+    """
+    parts = urlsplit(src)
+    shareable = not parts.query and not parts.fragment and "%2f" not in parts.path.lower()
+    if parts.scheme in ("http", "https") and shareable:
+        return _store(f"{parts.scheme}://{parts.netloc}/"), unquote(parts.path).lstrip("/")
+    return _store(src), ""
+
+
+@functools.lru_cache(maxsize=REMOTE_STORE_CACHE_SIZE)
+def _store(url: str) -> Any:
+    """Create an obstore store for url once and share it across threads."""
+    return from_url(url)
+
+
+def _coalesce_ranges(
+    ranges: list[tuple[str, int, int]],
+    max_gap: int,
+    max_bytes: int,
+) -> list[tuple[int, int, list[tuple[str, int, int]]]]:
+    """Merge (dest, offset, size) ranges into (start, end, members) runs.
+
+    Ranges are taken in offset order; one joins the current run when the gap
+    before it is at most max_gap and the run stays within max_bytes.
+    """
+    runs: list[tuple[int, int, list[tuple[str, int, int]]]] = []
+    for dest, offset, size in sorted(ranges, key=lambda r: r[1]):
+        end = offset + size
+        if runs:
+            run_start, run_end, members = runs[-1]
+            if offset - run_end <= max_gap and max(run_end, end) - run_start <= max_bytes:
+                members.append((dest, offset, size))
+                runs[-1] = (run_start, max(run_end, end), members)
+                continue
+        runs.append((offset, end, [(dest, offset, size)]))
+    return runs
+
+
+def _read_remote_runs(src: str, runs: list[tuple[int, int, list[tuple[str, int, int]]]]) -> Iterator[memoryview]:
+    """Fetch each coalesced run from one remote URL, one request per run.
+
+    Runs go out in groups whose requests obstore sends concurrently over
+    the store's pooled connections; a group is capped in count and bytes,
+    so no more than about one max-size run is held in memory at a time.
+    Each run is yielded as a view over obstore's buffer, so slicing out
+    members copies nothing.
+    """
+    store, path = _remote_location(src)
+    for group in _group_runs(runs, REMOTE_CONCURRENT_RANGES, RANGE_COALESCE_MAX_BYTES):
+        starts = [start for start, _, _ in group]
+        ends = [end for _, end, _ in group]
+        for data in obs.get_ranges(store, path, starts=starts, ends=ends, coalesce=0):
+            yield memoryview(data)
+
+
+def _group_runs(
+    runs: list[tuple[int, int, list[tuple[str, int, int]]]],
+    max_count: int,
+    max_bytes: int,
+) -> list[list[tuple[int, int, list[tuple[str, int, int]]]]]:
+    """Split runs, in order, into groups of at most max_count runs and max_bytes.
+
+    A run larger than max_bytes forms a group of its own.
+    """
+    groups: list[list[tuple[int, int, list[tuple[str, int, int]]]]] = []
+    group_bytes = 0
+    for run in runs:
+        run_bytes = run[1] - run[0]
+        if not groups or len(groups[-1]) >= max_count or group_bytes + run_bytes > max_bytes:
+            groups.append([])
+            group_bytes = 0
+        groups[-1].append(run)
+        group_bytes += run_bytes
+    return groups
 
 
-def _read_remote(src: str, offset: int | None, size: int | None) -> bytes:
-    """Read bytes from remote URL using tacoreader's I/O."""
+def _download_to(src: str, dest: str, offset: int | None = None, size: int | None = None) -> None:
+    """Stream a remote file, or a byte range of it, to dest without holding it in memory."""
+    store, path = _remote_location(src)
+    options: GetOptions = {}
     if offset is not None and size is not None:
-        return bytes(download_range(src, offset, size))
-    return bytes(download_bytes(src))
+        options["range"] = (offset, offset + size)
+    result = obs.get(store, path, options=options)
+    with open(dest, "wb") as f:
+        for chunk in result.stream(min_chunk_size=COPY_CHUNK_SIZE):
+            f.write(chunk)
 
 
-def _write_bytes(dest: str, data: bytes) -> None:
-    """Write bytes to local destination, creating parent dirs."""
+def _write_bytes(dest: str, data: bytes | memoryview, make_parents: bool = True) -> None:
+    """Write bytes to local destination, creating parent dirs unless told not to."""
     dest_path = Path(dest)
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    if make_parents:
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
     dest_path.write_bytes(data)
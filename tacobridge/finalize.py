@@ -12,9 +12,12 @@ Two finalization paths:
 """
 
 import json
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
+import pyarrow as pa
 from tacotoolbox._column_utils import write_parquet_file, write_parquet_file_with_cdc
 from tacotoolbox._metadata import MetadataPackage
 from tacotoolbox._writers.zip_writer import ZipWriter
@@ -24,6 +27,7 @@ from tacobridge._constants import (
     FOLDER_COLLECTION_FILENAME,
     FOLDER_META_FILENAME,
     FOLDER_METADATA_DIR,
+    LEVEL_PARQUET_OPTIONS,
     LEVEL_PARQUET_TEMPLATE,
     PIT_SCHEMA_KEY,
 )
@@ -33,12 +37,16 @@ from tacobridge._types import ExportPlan, Folder2ZipPlan, Zip2FolderPlan
 
 logger = get_logger(__name__)
 
+_ParquetWrite = tuple[Callable[..., None], pa.Table, Path, dict[str, Any]]
+"""Writer function, table, destination path and writer options."""
 
-def finalize(plan: ExportPlan | Zip2FolderPlan | Folder2ZipPlan) -> Path:
+
+def finalize(plan: ExportPlan | Zip2FolderPlan | Folder2ZipPlan, workers: int = 1) -> Path:
     """Finalize operation by writing metadata or packaging ZIP.
 
     Args:
         plan: Completed plan (tasks already executed for Export/Zip2Folder)
+        workers: Threads for writing parquet metadata (1 = sequential)
 
     Returns:
         Path to output
@@ -49,49 +57,112 @@ def finalize(plan: ExportPlan | Zip2FolderPlan | Folder2ZipPlan) -> Path:
     try:
         if isinstance(plan, Folder2ZipPlan):
             return _finalize_folder2zip(plan)
-        return _finalize_to_folder(plan)
+        return _finalize_to_folder(plan, workers)
     except TacoFinalizeError:
         raise
     except Exception as e:
         raise TacoFinalizeError(f"Failed to finalize: {e}") from e
 
 
-def _finalize_to_folder(plan: ExportPlan | Zip2FolderPlan) -> Path:
+def _finalize_to_folder(plan: ExportPlan | Zip2FolderPlan, workers: int) -> Path:
     """Write FOLDER structure: METADATA/, DATA/__meta__, COLLECTION.json."""
-    output = plan.output
+    write_folder_metadata(plan.output, plan.levels, plan.local_metadata, plan.collection, workers)
+    logger.info(f"Finalized FOLDER: {plan.output}")
+    return plan.output
+
+
+def write_folder_metadata(
+    output: Path,
+    levels: Sequence[pa.Table],
+    local_metadata: dict[str, pa.Table],
+    collection: dict[str, Any],
+    workers: int = 1,
+) -> None:
+    """Write METADATA/levelX.parquet, DATA/*/__meta__ and COLLECTION.json.
+
+    Level and __meta__ files are independent, so with workers > 1 they are
+    all written on one thread pool; parquet encoding and compression
+    release the GIL.
+    """
     metadata_dir = output / FOLDER_METADATA_DIR
     metadata_dir.mkdir(parents=True, exist_ok=True)
-
-    for i, table in enumerate(plan.levels):
-        path = metadata_dir / LEVEL_PARQUET_TEMPLATE.format(i)
-        write_parquet_file_with_cdc(table, path)
-        logger.debug(f"Wrote {path.name}: {table.num_rows} rows")
-
-    for folder_path, table in plan.local_metadata.items():
-        meta_path = output / folder_path / FOLDER_META_FILENAME
-        meta_path.parent.mkdir(parents=True, exist_ok=True)
-        write_parquet_file(table, meta_path)
-        logger.debug(f"Wrote {meta_path}")
-
-    collection_path = output / FOLDER_COLLECTION_FILENAME
-    collection_path.write_text(
-        json.dumps(plan.collection, indent=4, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    writes = [
+        (write_parquet_file_with_cdc, table, metadata_dir / LEVEL_PARQUET_TEMPLATE.format(i), LEVEL_PARQUET_OPTIONS)
+        for i, table in enumerate(levels)
+    ]
+    writes += _local_metadata_writes(local_metadata, output)
+    _run_parquet_writes(writes, workers)
+    logger.debug(f"Wrote {len(levels)} level files and {len(local_metadata)} {FOLDER_META_FILENAME} files")
+
+    write_collection(collection, output)
     logger.debug(f"Wrote {FOLDER_COLLECTION_FILENAME}")
 
-    logger.info(f"Finalized FOLDER: {output}")
-    return output
+
+def write_local_metadata(local_metadata: dict[str, pa.Table], root: Path, workers: int = 1) -> None:
+    """Write __meta__ files under root, in parallel when workers > 1.
+
+    Each table is small, so it is written as a single row group.
+    """
+    _run_parquet_writes(_local_metadata_writes(local_metadata, root), workers)
+
+
+def _local_metadata_writes(local_metadata: dict[str, pa.Table], root: Path) -> list[_ParquetWrite]:
+    """One write per __meta__ file, with the plain (non-CDC) writer."""
+    return [
+        (write_parquet_file, table, root / folder_path / FOLDER_META_FILENAME, {})
+        for folder_path, table in local_metadata.items()
+    ]
+
+
+def _run_parquet_writes(writes: list[_ParquetWrite], workers: int) -> None:
+    """Run parquet writes, creating every parent directory once beforehand.
+
+    Only the deepest directories are passed to mkdir; their ancestors come
+    with parents=True instead of costing a mkdir and stat of their own.
+    """
+    directories = {path.parent for _, _, path, _ in writes}
+    ancestors = {parent for directory in directories for parent in directory.parents}
+    for directory in sorted(directories - ancestors):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    if workers <= 1:
+        for writer, table, path, options in writes:
+            writer(table, path, **options)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(writer, table, path, **options) for writer, table, path, options in writes]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+        for future in done:
+            future.result()
+
+
+def write_collection(collection: dict[str, Any], root: Path) -> Path:
+    """Write COLLECTION.json under root.
+
+    Uses stdlib json with indent=4, the same layout tacotoolbox writes, so
+    the file is byte-identical whichever tool produced the folder.
+    """
+    collection_path: Path = root / FOLDER_COLLECTION_FILENAME
+    collection_path.write_text(json.dumps(collection, indent=4, ensure_ascii=False), encoding="utf-8")
+    return collection_path
 
 
 def _finalize_folder2zip(plan: Folder2ZipPlan) -> Path:
-    """Package FOLDER into ZIP using ZipWriter."""
+    """Package FOLDER into ZIP using ZipWriter.
+
+    ZipWriter adds ZIP offsets to the levels before encoding them, so they
+    cannot be pre-encoded here; LEVEL_PARQUET_OPTIONS keeps that encode fast.
+    """
     src_files = [entry.src for entry in plan.entries]
     arc_files = [entry.arc_path for entry in plan.entries]
 
     pit_schema: dict[str, Any] = plan.collection[PIT_SCHEMA_KEY]
     field_schema: dict[str, Any] = plan.collection[FIELD_SCHEMA_KEY]
 
+    # ZipWriter replaces entries of levels in place; copy so plan.levels is untouched
     metadata_package = MetadataPackage(
         levels=list(plan.levels),
         local_metadata=plan.local_metadata,
@@ -106,6 +177,7 @@ def _finalize_folder2zip(plan: Folder2ZipPlan) -> Path:
         src_files=src_files,
         arc_files=arc_files,
         metadata_package=metadata_package,
+        **LEVEL_PARQUET_OPTIONS,
     )
 
     logger.info(f"Finalized ZIP: {result}")
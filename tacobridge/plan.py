@@ -5,44 +5,58 @@ User controls execution strategy (sequential, threads, processes).
 """
 
 import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import tacoreader
 from tacoreader._vsi import parse_vsi_subfile, strip_vsi_prefix
 
 from tacobridge._constants import (
     COLUMN_ID,
+    COLUMN_TYPE,
     FOLDER_COLLECTION_FILENAME,
     FOLDER_DATA_DIR,
     FOLDER_META_FILENAME,
     FOLDER_METADATA_DIR,
-    METADATA_CURRENT_ID,
     METADATA_GDAL_VSI,
-    METADATA_PARENT_ID,
     METADATA_RELATIVE_PATH,
-    METADATA_SOURCE_FILE,
-    METADATA_SOURCE_PATH,
-    SAMPLE_TYPE_FOLDER,
     VSI_SUBFILE_PREFIX,
 )
 from tacobridge._exceptions import TacoPlanError
 from tacobridge._logging import get_logger
 from tacobridge._metadata import (
     build_local_metadata,
+    fetch_children,
+    folder_mask,
     prepare_collection,
     reindex_metadata_from_snapshot,
     strip_zip_columns,
 )
-from tacobridge._types import CopyTask, ExportPlan, Folder2ZipPlan, Zip2FolderPlan, ZipEntry
+from tacobridge._types import CopyTaskArray, ExportPlan, Folder2ZipPlan, Zip2FolderPlan, ZipEntry
 
 if TYPE_CHECKING:
     from tacoreader import TacoDataset
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger(__name__)
 
+_VSI_SUBFILE_PATTERN = r"^/vsisubfile/(?P<offset>\d+)_(?P<size>\d+),(?P<root>.+)$"
+"""Regex form of tacoreader's parse_vsi_subfile: /vsisubfile/{offset}_{size},{root}."""
+
+_IRREGULAR_NAME_PATTERN = r"^$|^/|//|/$|(^|/)\.(/|$)"
+"""Relative names that Path joining would normalise rather than append."""
+
 
 def plan_export(dataset: "TacoDataset", output: str | Path) -> ExportPlan:
     """Plan export operation from TacoDataset."""
@@ -77,7 +91,7 @@ def plan_export(dataset: "TacoDataset", output: str | Path) -> ExportPlan:
     collection = prepare_collection(dataset)
 
     return ExportPlan(
-        tasks=tuple(tasks),
+        tasks=tasks,
         source=dataset._path,
         output=output,
         levels=tuple(levels),
@@ -99,13 +113,16 @@ def plan_zip2folder(source: str | Path, output: str | Path) -> Zip2FolderPlan:
     except Exception as e:
         raise TacoPlanError(f"Failed to open dataset: {source}: {e}") from e
 
-    tasks = _collect_copy_tasks(dataset, output)
-    levels = strip_zip_columns(dataset)
+    # One level0 fetch serves both the copy tasks and the stripped metadata
+    level0_snapshot: pa.Table = dataset._duckdb.execute(f"SELECT * FROM {dataset._view_name}").fetch_arrow_table()
+    filtered_level_views: dict[int, str] = getattr(dataset, "_filtered_level_views", {})
+    tasks = _collect_copy_tasks_from_snapshot(dataset, level0_snapshot, output, filtered_level_views)
+    levels = strip_zip_columns(dataset, level0_snapshot)
     local_metadata = build_local_metadata(levels)
     collection: dict[str, Any] = dataset.collection.copy()
 
     return Zip2FolderPlan(
-        tasks=tuple(tasks),
+        tasks=tasks,
         source=source,
         output=output,
         levels=tuple(levels),
@@ -140,131 +157,109 @@ def plan_folder2zip(source: str | Path, output: str | Path) -> Folder2ZipPlan:
     )
 
 
-def _collect_copy_tasks(dataset: "TacoDataset", output: Path) -> list[CopyTask]:
-    """Collect all CopyTasks from dataset for byte transfer."""
-    table: pa.Table = dataset._duckdb.execute(f"SELECT * FROM {dataset._view_name}").fetch_arrow_table()
-    filtered_level_views: dict[int, str] = getattr(dataset, "_filtered_level_views", {})
-    return _collect_copy_tasks_from_snapshot(dataset, table, output, filtered_level_views)
-
-
 def _collect_copy_tasks_from_snapshot(
     dataset: "TacoDataset",
     level0_snapshot: pa.Table,
     output: Path,
     filtered_level_views: dict[int, str],
-) -> list[CopyTask]:
+) -> CopyTaskArray:
     """Collect all CopyTasks from snapshot for byte transfer.
 
+    Walks the hierarchy level by level: file rows of a level become tasks,
+    and the children of all its folder rows are fetched with one query
+    against the next level's view. Tasks are built as Arrow columns; no
+    CopyTask object is created while planning.
+
     Args:
         dataset: Source TacoDataset
         level0_snapshot: Pre-fetched level0 table
         output: Output directory path
         filtered_level_views: Cascade filter views mapping level -> view_name
     """
-    tasks: list[CopyTask] = []
     data_dir = output / FOLDER_DATA_DIR
+    max_depth: int = dataset.pit_schema.max_depth()
+    tasks: list[pa.Table] = []
 
-    for row in level0_snapshot.to_pylist():
-        if row["type"] == SAMPLE_TYPE_FOLDER:
-            children_tasks = _collect_folder_children(
-                dataset, row, data_dir, level=0, filtered_level_views=filtered_level_views
-            )
-            tasks.extend(children_tasks)
-        else:
-            vsi_path = row[METADATA_GDAL_VSI]
-            rel_path = row.get(METADATA_RELATIVE_PATH) or row[COLUMN_ID]
-            dest = data_dir / rel_path
-            task = _vsi_to_copy_task(vsi_path, str(dest))
-            tasks.append(task)
+    table = level0_snapshot
+    for level in range(max_depth + 1):
+        is_folder = folder_mask(table.column(COLUMN_TYPE))
+        tasks.append(_file_copy_tasks(table.filter(pc.invert(is_folder)), data_dir))
 
-    return tasks
+        folders = table.filter(is_folder)
+        if level == max_depth or folders.num_rows == 0:
+            break
 
+        # Use filtered view if cascade filter was applied at this level
+        view_name = filtered_level_views.get(level + 1, f"level{level + 1}")
+        table = fetch_children(dataset, view_name, folders)
 
-def _collect_folder_children(
-    dataset: "TacoDataset",
-    folder_row: dict[str, Any],
-    data_dir: Path,
-    level: int,
-    filtered_level_views: dict[int, str],
-) -> list[CopyTask]:
-    """Recursively collect CopyTasks for folder children.
+    return CopyTaskArray(pa.concat_tables(tasks))
 
-    Args:
-        dataset: Source TacoDataset
-        folder_row: Parent folder metadata row
-        data_dir: Output data directory
-        level: Current hierarchy level
-        filtered_level_views: Cascade filter views mapping level -> view_name
-    """
-    tasks: list[CopyTask] = []
-    current_id = folder_row[METADATA_CURRENT_ID]
-    next_level = level + 1
 
-    max_depth: int = dataset.pit_schema.max_depth()
-    if next_level > max_depth:
-        return tasks
-
-    # Use filtered view if cascade filter was applied at this level
-    view_name = filtered_level_views.get(next_level, f"level{next_level}")
-
-    children = _query_children(
-        dataset,
-        view_name,
-        current_id,
-        folder_row.get(METADATA_SOURCE_PATH),
-        folder_row.get(METADATA_SOURCE_FILE),
-    )
+def _file_copy_tasks(files: pa.Table, data_dir: Path) -> pa.Table:
+    """Build CopyTaskArray columns for every file row of a level table."""
+    names = files.column(COLUMN_ID)
+    if METADATA_RELATIVE_PATH in files.schema.names:
+        rel_paths = files.column(METADATA_RELATIVE_PATH)
+        names = pc.if_else(pc.fill_null(pc.not_equal(rel_paths, ""), False), rel_paths, names)
 
-    for child in children.to_pylist():
-        if child["type"] == SAMPLE_TYPE_FOLDER:
-            sub_tasks = _collect_folder_children(dataset, child, data_dir, next_level, filtered_level_views)
-            tasks.extend(sub_tasks)
-        else:
-            vsi_path = child[METADATA_GDAL_VSI]
-            rel_path = child.get(METADATA_RELATIVE_PATH) or child[COLUMN_ID]
-            dest = data_dir / rel_path
-            task = _vsi_to_copy_task(vsi_path, str(dest))
-            tasks.append(task)
+    src, offset, size = _vsi_copy_columns(files.column(METADATA_GDAL_VSI))
+    dest = _dest_column(data_dir, names)
+    return pa.table({"src": src, "dest": dest, "offset": offset, "size": size}).cast(CopyTaskArray.TASK_SCHEMA)
 
-    return tasks
 
+def _dest_column(data_dir: Path, names: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Join data_dir with every name, matching str(data_dir / name).
 
-def _query_children(
-    dataset: "TacoDataset",
-    view_name: str,
-    parent_id: int,
-    source_path: str | None,
-    source_file: str | None,
-) -> pa.Table:
-    """Query children from dataset with appropriate source filtering."""
-    if source_path:
-        table: pa.Table = dataset._duckdb.execute(
-            f'SELECT * FROM {view_name} WHERE "{METADATA_PARENT_ID}" = ? AND "{METADATA_SOURCE_PATH}" = ?',
-            [parent_id, source_path],
-        ).fetch_arrow_table()
-        return table
-
-    if source_file:
-        table = dataset._duckdb.execute(
-            f'SELECT * FROM {view_name} WHERE "{METADATA_PARENT_ID}" = ? AND "{METADATA_SOURCE_FILE}" = ?',
-            [parent_id, source_file],
-        ).fetch_arrow_table()
-        return table
-
-    table = dataset._duckdb.execute(
-        f'SELECT * FROM {view_name} WHERE "{METADATA_PARENT_ID}" = ?',
-        [parent_id],
-    ).fetch_arrow_table()
-    return table
-
-
-def _vsi_to_copy_task(vsi_path: str, dest: str) -> CopyTask:
-    """Convert GDAL VSI path to CopyTask."""
-    if vsi_path.startswith(VSI_SUBFILE_PREFIX):
-        zip_path, offset, size = parse_vsi_subfile(vsi_path)
-        src = strip_vsi_prefix(zip_path)
-        return CopyTask(src=src, dest=dest, offset=offset, size=size)
-    return CopyTask(src=vsi_path, dest=dest, offset=None, size=None)
+    Plain relative names are joined by one string concatenation over the
+    column. Names that Path would normalise (empty, absolute, '.' parts,
+    doubled or trailing '/') go through Path, as do all names on platforms
+    whose separator is not '/'.
+    """
+    names = pc.cast(names, pa.string())
+    dest = pc.binary_join_element_wise(f"{data_dir}/", names, "")
+    if os.sep != "/":
+        irregular = pc.is_valid(names)
+    else:
+        irregular = pc.match_substring_regex(names, _IRREGULAR_NAME_PATTERN)
+    if not pc.any(irregular).as_py():
+        return dest
+
+    fixed = [str(data_dir / name) for name in names.filter(irregular).to_pylist()]
+    return pc.replace_with_mask(dest.combine_chunks(), irregular.combine_chunks(), pa.array(fixed, type=pa.string()))
+
+
+def _vsi_copy_columns(vsi: pa.ChunkedArray) -> tuple[pa.ChunkedArray | pa.Array, ...]:
+    """Split GDAL VSI paths into CopyTask src, offset and size columns.
+
+    /vsisubfile/ paths are parsed with one regex pass over the column and
+    become (archive, offset, size), with the archive's VSI prefix stripped
+    once per distinct archive. Other paths are copied whole. The few
+    subfile paths the regex rejects go through tacoreader's
+    parse_vsi_subfile, so any spelling it accepts (e.g. "+12") still plans.
+
+    Raises:
+        TacoFormatError: If parse_vsi_subfile rejects a /vsisubfile/ path
+    """
+    parsed = pc.extract_regex(vsi, pattern=_VSI_SUBFILE_PATTERN)
+    is_subfile = pc.starts_with(vsi, VSI_SUBFILE_PREFIX)
+
+    roots = pc.struct_field(parsed, "root")
+    offset = pc.cast(pc.struct_field(parsed, "offset"), pa.int64())
+    size = pc.cast(pc.struct_field(parsed, "size"), pa.int64())
+
+    irregular = pc.and_(is_subfile, pc.is_null(parsed))
+    if pc.any(irregular).as_py():
+        rows = [parse_vsi_subfile(path) for path in vsi.filter(irregular).to_pylist()]
+        mask = irregular.combine_chunks()
+        roots = pc.replace_with_mask(roots.combine_chunks(), mask, pa.array([r[0] for r in rows], pa.string()))
+        offset = pc.replace_with_mask(offset.combine_chunks(), mask, pa.array([r[1] for r in rows], pa.int64()))
+        size = pc.replace_with_mask(size.combine_chunks(), mask, pa.array([r[2] for r in rows], pa.int64()))
+
+    archives = pc.unique(roots.drop_null())
+    stripped = pa.array([strip_vsi_prefix(archive) for archive in archives.to_pylist()], type=pa.string())
+    src = pc.if_else(is_subfile, stripped.take(pc.index_in(roots, value_set=archives)), vsi)
+    return src, offset, size
 
 
 def _read_collection(folder: Path) -> dict[str, Any]:
@@ -273,15 +268,35 @@ def _read_collection(folder: Path) -> dict[str, Any]:
     if not path.exists():
         raise TacoPlanError(f"{FOLDER_COLLECTION_FILENAME} not found: {path}")
 
+    data = path.read_bytes()
     try:
-        result: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        result: dict[str, Any] = _loads_json(data)
         return result
     except json.JSONDecodeError as e:
         raise TacoPlanError(f"Invalid {FOLDER_COLLECTION_FILENAME}: {e}") from e
 
 
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else stdlib json.
+
+    orjson rejects a few things stdlib json accepts (NaN, integers beyond
+    64 bits), so its failures are retried with stdlib json.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def _read_consolidated_metadata(folder: Path) -> list[pa.Table]:
-    """Read METADATA/levelX.parquet files in order."""
+    """Read METADATA/levelX.parquet files in order.
+
+    Files are memory-mapped, which only changes how the compressed pages
+    are read: they come from the page cache without a read() copy. The
+    decoded tables are fully materialized either way.
+    """
     metadata_dir = folder / FOLDER_METADATA_DIR
     if not metadata_dir.exists():
         raise TacoPlanError(f"{FOLDER_METADATA_DIR} directory not found: {metadata_dir}")
@@ -290,7 +305,7 @@ def _read_consolidated_metadata(folder: Path) -> list[pa.Table]:
     if not level_files:
         raise TacoPlanError(f"No level*.parquet files found: {metadata_dir}")
 
-    return [pq.read_table(f) for f in level_files]
+    return [pq.read_table(f, memory_map=True) for f in level_files]
 
 
 def _scan_folder_files(folder: Path) -> list[ZipEntry]:
@@ -299,14 +314,29 @@ def _scan_folder_files(folder: Path) -> list[ZipEntry]:
     if not data_dir.exists():
         raise TacoPlanError(f"{FOLDER_DATA_DIR} directory not found: {data_dir}")
 
-    entries: list[ZipEntry] = []
-    for file_path in data_dir.rglob("*"):
-        if file_path.is_file() and file_path.name != FOLDER_META_FILENAME:
-            rel = file_path.relative_to(data_dir)
-            arc_path = f"{FOLDER_DATA_DIR}/{rel}"
-            entries.append(ZipEntry(src=str(file_path), arc_path=arc_path))
+    entries = [ZipEntry(src=src, arc_path=arc_path) for src, arc_path in iter_data_files(data_dir)]
 
     if not entries:
         raise TacoPlanError(f"No data files found: {data_dir}")
 
     return entries
+
+
+def iter_data_files(data_dir: Path) -> Iterator[tuple[str, str]]:
+    """Yield (path, arc_path) for every data file under DATA/, skipping __meta__.
+
+    Walks with os.scandir so each entry's type comes from the directory
+    listing itself; no Path objects or extra stat calls per file. Only
+    symlinks cost a stat: symlinked files are packaged like regular files,
+    while symlinked directories are not descended into.
+    """
+    stack = [(str(data_dir), FOLDER_DATA_DIR)]
+    while stack:
+        directory, arc_dir = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                arc_path = f"{arc_dir}/{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, arc_path))
+                elif entry.is_file() and entry.name != FOLDER_META_FILENAME:
+                    yield entry.path, arc_path
@@ -5,6 +5,8 @@ from pathlib import Path
 
 import tacoreader
 
+from tacobridge.plan import plan_export
+
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
@@ -50,4 +52,25 @@ def flat_a_zip_path():
 
 @pytest.fixture
 def nested_a_zip_path():
-    return FIXTURES / "zip/nested_a/nested_a.tacozip"
\ No newline at end of file
+    return FIXTURES / "zip/nested_a/nested_a.tacozip"
+
+
+# Plans of the unfiltered fixtures, shared by tests that only read them
+
+
+@pytest.fixture(scope="module")
+def flat_export_plan(tmp_path_factory):
+    dataset = tacoreader.load(FIXTURES / "zip/flat_a/flat_a.tacozip")
+    return plan_export(dataset, tmp_path_factory.mktemp("flat") / "out")
+
+
+@pytest.fixture(scope="module")
+def nested_export_plan(tmp_path_factory):
+    dataset = tacoreader.load(FIXTURES / "zip/nested_a/nested_a.tacozip")
+    return plan_export(dataset, tmp_path_factory.mktemp("nested") / "out")
+
+
+@pytest.fixture(scope="module")
+def deep_export_plan(tmp_path_factory):
+    dataset = tacoreader.load(FIXTURES / "zip/deep/deep.tacozip")
+    return plan_export(dataset, tmp_path_factory.mktemp("deep") / "out")
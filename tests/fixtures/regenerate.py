@@ -60,18 +60,18 @@ BBOXES = {
 }
 
 
+_POLYGON_WKB = struct.Struct("<bIII10d")  # LE, Polygon, 1 ring, 5 points (closed)
+_POINT_WKB = struct.Struct("<bIdd")  # LE, Point
+
+
 def _polygon_wkb(minx: float, miny: float, maxx: float, maxy: float) -> bytes:
     """Create WKB polygon from bbox."""
-    wkb = struct.pack("<bII", 1, 3, 1)  # LE, Polygon, 1 ring
-    wkb += struct.pack("<I", 5)  # 5 points (closed)
-    for x, y in [(minx, miny), (maxx, miny), (maxx, maxy), (minx, maxy), (minx, miny)]:
-        wkb += struct.pack("<dd", x, y)
-    return wkb
+    return _POLYGON_WKB.pack(1, 3, 1, 5, minx, miny, maxx, miny, maxx, maxy, minx, maxy, minx, miny)
 
 
 def _point_wkb(lon: float, lat: float) -> bytes:
     """Create WKB point."""
-    return struct.pack("<bIdd", 1, 1, lon, lat)
+    return _POINT_WKB.pack(1, 1, lon, lat)
 
 
 def _centroid(bbox: tuple[float, float, float, float]) -> tuple[float, float]:
@@ -1,5 +1,10 @@
 """Integration tests for tacobridge.api module."""
 
+import itertools
+import shutil
+import time
+import zipfile
+
 import pytest
 import tacoreader
 
@@ -11,9 +16,9 @@ def _count(ds):
     return ds.pit_schema.root["n"]
 
 
-def _to_df(ds):
-    """Get level0 as pandas dataframe."""
-    return ds._duckdb.execute("SELECT * FROM data").fetch_arrow_table().to_pandas()
+def _to_table(ds):
+    """Get level0 as an Arrow table."""
+    return ds._duckdb.execute("SELECT * FROM data").fetch_arrow_table()
 
 
 class TestExport:
@@ -75,9 +80,9 @@ class TestExport:
         result = export(flat_a_zip, tmp_path / "out")
 
         ds = tacoreader.load(result)
-        df = _to_df(ds)
-        assert "cloud_cover" in df.columns
-        assert "location" in df.columns
+        tbl = _to_table(ds)
+        assert "cloud_cover" in tbl.column_names
+        assert "location" in tbl.column_names
 
     def test_export_with_workers(self, flat_a_zip, tmp_path):
         result = export(flat_a_zip, tmp_path / "out", workers=4)
@@ -85,6 +90,19 @@ class TestExport:
         ds = tacoreader.load(result)
         assert _count(ds) == 10
 
+    def test_export_with_more_batches_than_in_flight(self, flat_a_zip, tmp_path, monkeypatch):
+        monkeypatch.setattr("tacobridge.api.EXECUTE_BATCH_SIZE", 1)
+        result = export(flat_a_zip, tmp_path / "out", workers=2)
+
+        ds = tacoreader.load(result)
+        assert _count(ds) == 10
+
+    def test_export_nested_to_zip_with_workers(self, nested_a_zip, tmp_path):
+        result = export(nested_a_zip, tmp_path / "out.tacozip", workers=4)
+
+        ds = tacoreader.load(result)
+        assert _count(ds) == 5
+
     def test_export_zip_strips_extension_for_folder(self, flat_a_zip, tmp_path):
         output = tmp_path / "out.tacozip"
         result = export(flat_a_zip, output, output_format="folder")
@@ -120,10 +138,48 @@ class TestZip2Folder:
         ds_original = tacoreader.load(flat_a_zip_path)
         ds_converted = tacoreader.load(result)
 
-        df_orig = _to_df(ds_original)
-        df_conv = _to_df(ds_converted)
+        tbl_orig = _to_table(ds_original)
+        tbl_conv = _to_table(ds_converted)
+
+        assert tbl_orig.column("id").to_pylist() == tbl_conv.column("id").to_pylist()
+
+    def test_converts_with_workers(self, nested_a_zip_path, nested_a_folder, tmp_path):
+        result = zip2folder(nested_a_zip_path, tmp_path / "out", workers=4)
+
+        for src in (nested_a_folder / "DATA").rglob("item_*"):
+            rel = src.relative_to(nested_a_folder)
+            assert (result / rel).read_bytes() == src.read_bytes()
 
-        assert list(df_orig["id"]) == list(df_conv["id"])
+        for meta in (nested_a_folder / "DATA").rglob("__meta__"):
+            assert (result / meta.relative_to(nested_a_folder)).exists()
+
+
+    def test_keeps_empty_directories(self, flat_a_zip_path, tmp_path):
+        source = shutil.copy(flat_a_zip_path, tmp_path / "src.tacozip")
+        with zipfile.ZipFile(source, "a") as zf:
+            zf.writestr("DATA/empty/", b"")
+
+        result = zip2folder(source, tmp_path / "out")
+
+        assert (result / "DATA" / "empty").is_dir()
+
+    def test_failed_member_stops_extraction(self, flat_a_zip_path, tmp_path, monkeypatch):
+        calls = itertools.count()
+
+        def copy(src, dst, length):
+            call = next(calls)
+            if call == 0:
+                time.sleep(0.5)
+            elif call == 1:
+                raise OSError("disk full")
+            else:
+                time.sleep(0.05)
+
+        monkeypatch.setattr("tacobridge.api.shutil.copyfileobj", copy)
+
+        with pytest.raises(OSError, match="disk full"):
+            zip2folder(flat_a_zip_path, tmp_path / "out", workers=2)
+        assert next(calls) < 10
 
 
 class TestFolder2Zip:
@@ -152,7 +208,13 @@ class TestFolder2Zip:
         ds_original = tacoreader.load(flat_a_folder)
         ds_converted = tacoreader.load(result)
 
-        df_orig = _to_df(ds_original)
-        df_conv = _to_df(ds_converted)
+        tbl_orig = _to_table(ds_original)
+        tbl_conv = _to_table(ds_converted)
+
+        assert tbl_orig.column("id").to_pylist() == tbl_conv.column("id").to_pylist()
+
+    def test_entries_are_stored(self, nested_a_folder, tmp_path):
+        result = folder2zip(nested_a_folder, tmp_path / "out.tacozip")
 
-        assert list(df_orig["id"]) == list(df_conv["id"])
\ No newline at end of file
+        with zipfile.ZipFile(result) as zf:
+            assert {info.compress_type for info in zf.infolist()} == {zipfile.ZIP_STORED}
@@ -10,8 +10,8 @@ def _count(ds):
     return ds.pit_schema.root["n"]
 
 
-def _to_df(ds):
-    return ds._duckdb.execute("SELECT * FROM data").fetch_arrow_table().to_pandas()
+def _to_table(ds):
+    return ds._duckdb.execute("SELECT * FROM data").fetch_arrow_table()
 
 
 class TestConcatExport:
@@ -28,9 +28,9 @@ class TestConcatExport:
         result = export(concat, tmp_path / "out")
 
         ds = tacoreader.load(result)
-        df = _to_df(ds)
+        tbl = _to_table(ds)
 
-        regions = set(df["region"])
+        regions = set(tbl.column("region").to_pylist())
         assert regions == {"west", "east"}
 
     def test_concat_nested_datasets(self, nested_a_zip, nested_b_zip, tmp_path):
@@ -46,9 +46,9 @@ class TestConcatExport:
         result = export(filtered, tmp_path / "out")
 
         ds = tacoreader.load(result)
-        df = _to_df(ds)
+        tbl = _to_table(ds)
 
-        assert all(df["cloud_cover"] < 30)
+        assert all(value < 30 for value in tbl.column("cloud_cover").to_pylist())
 
     def test_concat_filter_by_region(self, flat_a_zip, flat_b_zip, tmp_path):
         concat = tacoreader.concat([flat_a_zip, flat_b_zip])
@@ -63,9 +63,9 @@ class TestConcatExport:
         result = export(concat, tmp_path / "out")
 
         ds = tacoreader.load(result)
-        df = _to_df(ds)
+        tbl = _to_table(ds)
 
-        current_ids = df["internal:current_id"].tolist()
+        current_ids = tbl.column("internal:current_id").to_pylist()
         assert current_ids == list(range(20))
 
     def test_concat_nested_children_preserved(self, nested_a_zip, nested_b_zip, tmp_path):
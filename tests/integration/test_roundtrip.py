@@ -10,8 +10,8 @@ def _count(ds):
     return ds.pit_schema.root["n"]
 
 
-def _to_df(ds):
-    return ds._duckdb.execute("SELECT * FROM data").fetch_arrow_table().to_pandas()
+def _to_table(ds):
+    return ds._duckdb.execute("SELECT * FROM data").fetch_arrow_table()
 
 
 class TestZipFolderZip:
@@ -32,16 +32,16 @@ class TestZipFolderZip:
 
     def test_data_integrity(self, flat_a_zip_path, tmp_path):
         ds_original = tacoreader.load(flat_a_zip_path)
-        df_orig = _to_df(ds_original)
+        tbl_orig = _to_table(ds_original)
 
         folder = zip2folder(flat_a_zip_path, tmp_path / "folder")
         result = folder2zip(folder, tmp_path / "out.tacozip")
 
         ds_final = tacoreader.load(result)
-        df_final = _to_df(ds_final)
+        tbl_final = _to_table(ds_final)
 
-        assert list(df_orig["id"]) == list(df_final["id"])
-        assert list(df_orig["location"]) == list(df_final["location"])
+        assert tbl_orig.column("id").to_pylist() == tbl_final.column("id").to_pylist()
+        assert tbl_orig.column("location").to_pylist() == tbl_final.column("location").to_pylist()
 
     def test_nested_children_intact(self, nested_a_zip_path, tmp_path):
         folder = zip2folder(nested_a_zip_path, tmp_path / "folder")
@@ -70,15 +70,15 @@ class TestFolderZipFolder:
 
     def test_data_integrity(self, flat_a_folder, tmp_path):
         ds_original = tacoreader.load(flat_a_folder)
-        df_orig = _to_df(ds_original)
+        tbl_orig = _to_table(ds_original)
 
         zip_path = folder2zip(flat_a_folder, tmp_path / "out.tacozip")
         result = zip2folder(zip_path, tmp_path / "folder")
 
         ds_final = tacoreader.load(result)
-        df_final = _to_df(ds_final)
+        tbl_final = _to_table(ds_final)
 
-        assert list(df_orig["id"]) == list(df_final["id"])
+        assert tbl_orig.column("id").to_pylist() == tbl_final.column("id").to_pylist()
 
 
 class TestExportRoundtrip:
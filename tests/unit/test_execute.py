@@ -1,11 +1,24 @@
 """Tests for tacobridge.execute module."""
 
-import pytest
+import importlib
 
-from tacobridge.execute import execute, _read_bytes, _write_bytes
-from tacobridge._types import CopyTask
+import pytest
+from obstore.store import LocalStore
+
+from tacobridge.execute import (
+    execute,
+    execute_batch,
+    _coalesce_ranges,
+    _group_runs,
+    _remote_location,
+    _write_bytes,
+    make_dest_dirs,
+)
+from tacobridge._types import CopyTask, CopyTaskArray
 from tacobridge._exceptions import TacoExecuteError
 
+execute_module = importlib.import_module("tacobridge.execute")
+
 
 class TestExecute:
 
@@ -39,6 +52,54 @@ class TestExecute:
 
         assert dest.read_bytes() == b"hello"
 
+    def test_copy_offset_to_end(self, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"0123456789")
+        dest = tmp_path / "dest.bin"
+
+        execute(CopyTask(src=str(src), dest=str(dest), offset=7))
+
+        assert dest.read_bytes() == b"789"
+
+    def test_copy_with_offset_buffered_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(execute_module, "_copy_file_range", lambda *args: False)
+        monkeypatch.setattr(execute_module, "COPY_CHUNK_SIZE", 2)
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"0123456789")
+        dest = tmp_path / "dest.bin"
+
+        execute(CopyTask(src=str(src), dest=str(dest), offset=3, size=5))
+
+        assert dest.read_bytes() == b"34567"
+
+    def test_copy_file_range_returning_zero_falls_back(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(execute_module.os, "copy_file_range", lambda *args: 0, raising=False)
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"0123456789")
+        dest = tmp_path / "dest.bin"
+
+        execute(CopyTask(src=str(src), dest=str(dest), offset=3, size=5))
+
+        assert dest.read_bytes() == b"34567"
+
+    def test_range_past_end_raises(self, tmp_path):
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"0123456789")
+
+        with pytest.raises(TacoExecuteError, match="ended after 2 of 5 bytes"):
+            execute(CopyTask(src=str(src), dest=str(tmp_path / "dest.bin"), offset=8, size=5))
+
+    def test_remote_range_streamed(self, tmp_path, monkeypatch):
+        (tmp_path / "a.tacozip").write_bytes(bytes(range(100)))
+        store = LocalStore(str(tmp_path))
+        monkeypatch.setattr(execute_module, "_remote_location", lambda src: (store, "a.tacozip"))
+        monkeypatch.setattr(execute_module, "COPY_CHUNK_SIZE", 4)
+        dest = tmp_path / "out" / "dest.bin"
+
+        execute(CopyTask(src="https://example.com/a.tacozip", dest=str(dest), offset=10, size=30))
+
+        assert dest.read_bytes() == bytes(range(10, 40))
+
     def test_creates_parent_dirs(self, tmp_path):
         src = tmp_path / "src.bin"
         src.write_bytes(b"data")
@@ -75,28 +136,215 @@ class TestExecute:
             dest.parent.chmod(0o755)
 
 
-class TestReadBytes:
+class TestExecuteBatch:
 
-    def test_read_full(self, tmp_path):
+    def test_local_tasks(self, tmp_path):
         src = tmp_path / "src.bin"
-        src.write_bytes(b"0123456789")
+        src.write_bytes(b"hello world")
+        tasks = [
+            CopyTask(src=str(src), dest=str(tmp_path / "a.bin"), offset=0, size=5),
+            CopyTask(src=str(src), dest=str(tmp_path / "b.bin"), offset=6, size=5),
+            CopyTask(src=str(src), dest=str(tmp_path / "c.bin")),
+        ]
 
-        data = _read_bytes(str(src), None, None)
-        assert data == b"0123456789"
+        execute_batch(tasks)
 
-    def test_read_with_offset_and_size(self, tmp_path):
+        assert (tmp_path / "a.bin").read_bytes() == b"hello"
+        assert (tmp_path / "b.bin").read_bytes() == b"world"
+        assert (tmp_path / "c.bin").read_bytes() == b"hello world"
+
+    def test_creates_nested_dest_dirs(self, tmp_path):
         src = tmp_path / "src.bin"
-        src.write_bytes(b"0123456789")
+        src.write_bytes(b"data")
+        dests = [
+            tmp_path / "out" / "x" / "a.bin",
+            tmp_path / "out" / "x" / "b.bin",
+            tmp_path / "out" / "y" / "z" / "c.bin",
+        ]
+
+        execute_batch([CopyTask(src=str(src), dest=str(dest)) for dest in dests])
+
+        assert all(dest.read_bytes() == b"data" for dest in dests)
+
+    def test_remote_ranges_grouped_by_source(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_runs(src, runs):
+            calls.append((src, [(start, end) for start, end, _ in runs]))
+            for start, end, _ in runs:
+                yield bytes(i % 256 for i in range(start, end))
+
+        monkeypatch.setattr(execute_module, "_read_remote_runs", fake_runs)
+        url_a = "https://example.com/a.tacozip"
+        url_b = "https://example.com/b.tacozip"
+        tasks = [
+            CopyTask(src=url_a, dest=str(tmp_path / "1"), offset=0, size=10),
+            CopyTask(src=url_b, dest=str(tmp_path / "2"), offset=5, size=5),
+            CopyTask(src=url_a, dest=str(tmp_path / "3"), offset=12, size=20),
+        ]
+
+        execute_batch(tasks)
+
+        assert calls == [(url_a, [(0, 32)]), (url_b, [(5, 10)])]
+        assert (tmp_path / "3").read_bytes() == bytes(range(12, 32))
+        assert (tmp_path / "2").read_bytes() == bytes(range(5, 10))
+
+    def test_remote_runs_fetched_as_groups(self, tmp_path, monkeypatch):
+        (tmp_path / "a.tacozip").write_bytes(bytes(range(200)))
+        store = LocalStore(str(tmp_path))
+        monkeypatch.setattr(execute_module, "_remote_location", lambda src: (store, "a.tacozip"))
+        monkeypatch.setattr(execute_module, "RANGE_COALESCE_GAP", 0)
+        monkeypatch.setattr(execute_module, "REMOTE_CONCURRENT_RANGES", 2)
+        url = "https://example.com/a.tacozip"
+        tasks = [
+            CopyTask(src=url, dest=str(tmp_path / "out" / str(offset)), offset=offset, size=10)
+            for offset in (0, 20, 40, 60, 80)
+        ]
+
+        execute_batch(tasks)
+
+        for offset in (0, 20, 40, 60, 80):
+            assert (tmp_path / "out" / str(offset)).read_bytes() == bytes(range(offset, offset + 10))
+
+    def test_local_source_opened_once(self, tmp_path, monkeypatch):
+        src = tmp_path / "src.zip"
+        src.write_bytes(b"aaaabbbbcccc")
+        opened = []
+
+        def tracking_open(file, *args, **kwargs):
+            opened.append(str(file))
+            return open(file, *args, **kwargs)
+
+        monkeypatch.setattr(execute_module, "open", tracking_open, raising=False)
+        tasks = [CopyTask(src=str(src), dest=str(tmp_path / n), offset=o, size=4) for n, o in (("b", 4), ("a", 0))]
+
+        execute_batch(tasks)
+
+        assert opened.count(str(src)) == 1
+        assert (tmp_path / "b").read_bytes() == b"bbbb"
+
+    def test_failure_raises(self, tmp_path):
+        task = CopyTask(src=str(tmp_path / "nope.bin"), dest=str(tmp_path / "dest.bin"))
+        with pytest.raises(TacoExecuteError):
+            execute_batch([task])
 
-        data = _read_bytes(str(src), 3, 4)
-        assert data == b"3456"
+    def test_ranged_failure_raises(self, tmp_path):
+        task = CopyTask(src=str(tmp_path / "nope.zip"), dest=str(tmp_path / "dest.bin"), offset=0, size=4)
+        with pytest.raises(TacoExecuteError, match="1 ranges"):
+            execute_batch([task])
 
-    def test_read_offset_only(self, tmp_path):
+    def test_unsorted_ranges_same_source(self, tmp_path):
+        src = tmp_path / "src.zip"
+        src.write_bytes(b"aaaabbbbcccc")
+        offsets = {"c": 8, "a": 0, "b": 4}
+        tasks = [CopyTask(src=str(src), dest=str(tmp_path / n), offset=o, size=4) for n, o in offsets.items()]
+
+        execute_batch(tasks)
+
+        assert [(tmp_path / n).read_bytes() for n in "abc"] == [b"aaaa", b"bbbb", b"cccc"]
+
+
+class TestMakeDestDirs:
+
+    def test_only_deepest_dirs_created(self, tmp_path, monkeypatch):
+        created = []
+        monkeypatch.setattr(execute_module.os, "makedirs", lambda name, exist_ok: created.append(name))
+        dests = ["x/a.bin", "x/b.bin", "x/y/c.bin", "z/d.bin"]
+
+        make_dest_dirs([CopyTask(src="s", dest=str(tmp_path / d)) for d in dests])
+
+        assert created == [str(tmp_path / "x" / "y"), str(tmp_path / "z")]
+
+    def test_task_array_dirs_deduplicated(self, tmp_path, monkeypatch):
+        created = []
+        monkeypatch.setattr(execute_module.os, "makedirs", lambda name, exist_ok: created.append(name))
+        dests = ["x/a.bin", "x/b.bin", "x/y/c.bin", "z/d.bin", "z/e.bin"]
+
+        make_dest_dirs(CopyTaskArray.from_tasks([CopyTask(src="s", dest=str(tmp_path / d)) for d in dests]))
+
+        assert created == [str(tmp_path / "x" / "y"), str(tmp_path / "z")]
+
+    def test_accepts_task_array(self, tmp_path):
+        tasks = CopyTaskArray.from_tasks([CopyTask(src="s", dest=str(tmp_path / "a" / "b" / "c.bin"))])
+
+        make_dest_dirs(tasks)
+
+        assert (tmp_path / "a" / "b").is_dir()
+
+
+class TestCoalesceRanges:
+
+    def test_merges_within_gap(self):
+        runs = _coalesce_ranges([("b", 110, 10), ("a", 0, 100)], max_gap=10, max_bytes=1000)
+        assert runs == [(0, 120, [("a", 0, 100), ("b", 110, 10)])]
+
+    def test_splits_on_gap(self):
+        runs = _coalesce_ranges([("a", 0, 100), ("b", 111, 10)], max_gap=10, max_bytes=1000)
+        assert [(start, end) for start, end, _ in runs] == [(0, 100), (111, 121)]
+
+    def test_splits_on_max_bytes(self):
+        runs = _coalesce_ranges([("a", 0, 60), ("b", 60, 60), ("c", 120, 200)], max_gap=0, max_bytes=100)
+        assert [(start, end) for start, end, _ in runs] == [(0, 60), (60, 120), (120, 320)]
+
+
+class TestGroupRuns:
+
+    def test_caps_count(self):
+        runs = [(i * 10, i * 10 + 5, []) for i in range(5)]
+        groups = _group_runs(runs, max_count=2, max_bytes=1000)
+        assert [len(group) for group in groups] == [2, 2, 1]
+
+    def test_caps_bytes_and_keeps_large_run_alone(self):
+        runs = [(0, 40, []), (50, 90, []), (100, 300, []), (300, 310, [])]
+        groups = _group_runs(runs, max_count=8, max_bytes=100)
+        assert [[start for start, _, _ in group] for group in groups] == [[0, 50], [100], [300]]
+
+
+class TestRemoteLocation:
+
+    def test_http_urls_share_store_per_host(self):
+        store_a, path_a = _remote_location("https://example.com/data/a.tacozip")
+        store_b, path_b = _remote_location("https://example.com/other/b%20c.tif")
+        assert store_a is store_b
+        assert path_a == "data/a.tacozip"
+        assert path_b == "other/b c.tif"
+
+    def test_signed_url_keeps_full_url(self):
+        url = "https://example.com/a.tacozip?sig=abc"
+        store, path = _remote_location(url)
+        assert path == ""
+        assert store is _remote_location(url)[0]
+        assert store is not _remote_location("https://example.com/a.tacozip")[0]
+
+    def test_encoded_slash_keeps_full_url(self):
+        url = "https://example.com/data/a%2Fb.tif"
+        store, path = _remote_location(url)
+        assert path == ""
+        assert store is not _remote_location("https://example.com/data/a/b.tif")[0]
+
+    def test_encoded_percent_decoded_once(self):
+        _, path = _remote_location("https://example.com/data/a%2525b.tif")
+        assert path == "data/a%25b.tif"
+
+
+class TestReadBytes:
+
+    def _read(self, tmp_path, offset, size):
         src = tmp_path / "src.bin"
         src.write_bytes(b"0123456789")
+        dest = tmp_path / "dest.bin"
 
-        data = _read_bytes(str(src), 5, None)
-        assert data == b"56789"
+        execute(CopyTask(src=str(src), dest=str(dest), offset=offset, size=size))
+        return dest.read_bytes()
+
+    def test_read_full(self, tmp_path):
+        assert self._read(tmp_path, None, None) == b"0123456789"
+
+    def test_read_with_offset_and_size(self, tmp_path):
+        assert self._read(tmp_path, 3, 4) == b"3456"
+
+    def test_read_offset_only(self, tmp_path):
+        assert self._read(tmp_path, 5, None) == b"56789"
 
 
 class TestWriteBytes:
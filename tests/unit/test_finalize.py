@@ -6,8 +6,8 @@ import pytest
 import pyarrow.parquet as pq
 
 from tacobridge.plan import plan_export, plan_zip2folder, plan_folder2zip
-from tacobridge.execute import execute
-from tacobridge.finalize import finalize
+from tacobridge.execute import execute_batch
+from tacobridge.finalize import finalize, write_folder_metadata
 from tacobridge._exceptions import TacoFinalizeError
 
 
@@ -16,8 +16,7 @@ class TestFinalizeExport:
     def test_creates_output_dir(self, flat_a_zip, tmp_path):
         output = tmp_path / "out"
         plan = plan_export(flat_a_zip, output)
-        for task in plan.tasks:
-            execute(task)
+        execute_batch(plan.tasks)
 
         result = finalize(plan)
 
@@ -27,8 +26,7 @@ class TestFinalizeExport:
     def test_writes_collection_json(self, flat_a_zip, tmp_path):
         output = tmp_path / "out"
         plan = plan_export(flat_a_zip, output)
-        for task in plan.tasks:
-            execute(task)
+        execute_batch(plan.tasks)
         finalize(plan)
 
         collection_path = output / "COLLECTION.json"
@@ -40,8 +38,7 @@ class TestFinalizeExport:
     def test_writes_metadata_parquet(self, flat_a_zip, tmp_path):
         output = tmp_path / "out"
         plan = plan_export(flat_a_zip, output)
-        for task in plan.tasks:
-            execute(task)
+        execute_batch(plan.tasks)
         finalize(plan)
 
         level0 = output / "METADATA" / "level0.parquet"
@@ -50,11 +47,19 @@ class TestFinalizeExport:
         table = pq.read_table(level0)
         assert table.num_rows == 10
 
+    def test_metadata_parquet_is_zstd(self, flat_a_zip, tmp_path):
+        output = tmp_path / "out"
+        plan = plan_export(flat_a_zip, output)
+        execute_batch(plan.tasks)
+        finalize(plan)
+
+        meta = pq.ParquetFile(output / "METADATA" / "level0.parquet").metadata
+        assert meta.row_group(0).column(0).compression == "ZSTD"
+
     def test_nested_writes_local_metadata(self, nested_a_zip, tmp_path):
         output = tmp_path / "out"
         plan = plan_export(nested_a_zip, output)
-        for task in plan.tasks:
-            execute(task)
+        execute_batch(plan.tasks)
         finalize(plan)
 
         meta_files = list(output.rglob("__meta__"))
@@ -63,21 +68,28 @@ class TestFinalizeExport:
     def test_nested_writes_two_levels(self, nested_a_zip, tmp_path):
         output = tmp_path / "out"
         plan = plan_export(nested_a_zip, output)
-        for task in plan.tasks:
-            execute(task)
+        execute_batch(plan.tasks)
         finalize(plan)
 
         assert (output / "METADATA" / "level0.parquet").exists()
         assert (output / "METADATA" / "level1.parquet").exists()
 
+    def test_nested_with_workers(self, nested_a_zip, tmp_path):
+        output = tmp_path / "out"
+        plan = plan_export(nested_a_zip, output)
+        execute_batch(plan.tasks)
+        finalize(plan, workers=4)
+
+        assert len(list(output.rglob("__meta__"))) == 5
+        assert pq.read_table(output / "METADATA" / "level1.parquet").num_rows == 15
+
 
 class TestFinalizeZip2Folder:
 
     def test_creates_folder_structure(self, flat_a_zip_path, tmp_path):
         output = tmp_path / "out"
         plan = plan_zip2folder(flat_a_zip_path, output)
-        for task in plan.tasks:
-            execute(task)
+        execute_batch(plan.tasks)
 
         result = finalize(plan)
 
@@ -89,8 +101,7 @@ class TestFinalizeZip2Folder:
     def test_data_files_exist(self, flat_a_zip_path, tmp_path):
         output = tmp_path / "out"
         plan = plan_zip2folder(flat_a_zip_path, output)
-        for task in plan.tasks:
-            execute(task)
+        execute_batch(plan.tasks)
         finalize(plan)
 
         data_files = list((output / "DATA").rglob("*"))
@@ -127,4 +138,14 @@ class TestFinalizeFolder2Zip:
         finalize(plan)
 
         ds = tacoreader.load(output)
-        assert ds.pit_schema.root["n"] == 5  # 5 folders at level0
\ No newline at end of file
+        assert ds.pit_schema.root["n"] == 5  # 5 folders at level0
+
+
+class TestWriteFolderMetadata:
+
+    def test_creates_metadata_dir_without_levels(self, tmp_path):
+        output = tmp_path / "out"
+        write_folder_metadata(output, [], {}, {"id": "empty"})
+
+        assert (output / "METADATA").is_dir()
+        assert json.loads((output / "COLLECTION.json").read_text()) == {"id": "empty"}
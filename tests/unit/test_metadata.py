@@ -8,7 +8,11 @@ from tacobridge._metadata import (
     reindex_table,
     build_local_metadata,
     get_source_key,
+    source_key_array,
     prepare_collection,
+    reindex_metadata_from_snapshot,
+    strip_zip_columns,
+    folder_mask,
 )
 from tacobridge._constants import (
     EXPORT_STRIP_COLUMNS,
@@ -42,6 +46,7 @@ class TestStripColumns:
         result = strip_columns(table, ("__offset__", "__size__"))
 
         assert result.num_columns == 2
+        assert result is table
 
     def test_default_strips_export_columns(self):
         table = pa.table({
@@ -97,6 +102,27 @@ class TestReindexTable:
         assert result.column(METADATA_CURRENT_ID).to_pylist() == [0, 1, 2]
         assert result.column(METADATA_PARENT_ID).to_pylist() == [0, 0, 1]
 
+    def test_accepts_ranges_and_arrow_arrays(self):
+        table = pa.table({
+            METADATA_CURRENT_ID: [100, 101, 102],
+            METADATA_PARENT_ID: [50, 50, 51],
+        })
+
+        result = reindex_table(table, range(3), pa.array([7, 7, 8], type=pa.int32()))
+
+        assert result.column(METADATA_CURRENT_ID).to_pylist() == [0, 1, 2]
+        assert result.column(METADATA_PARENT_ID).to_pylist() == [7, 7, 8]
+        assert result.schema.field(METADATA_PARENT_ID).type == pa.int64()
+
+    def test_stepped_and_empty_ranges(self):
+        table = pa.table({METADATA_CURRENT_ID: [1, 2, 3], METADATA_PARENT_ID: [1, 2, 3]})
+        result = reindex_table(table, range(10, 1, -3), range(5, 8))
+        assert result.column(METADATA_CURRENT_ID).to_pylist() == [10, 7, 4]
+        assert result.column(METADATA_PARENT_ID).to_pylist() == [5, 6, 7]
+
+        empty = pa.table({METADATA_CURRENT_ID: pa.array([], pa.int64()), METADATA_PARENT_ID: pa.array([], pa.int64())})
+        assert reindex_table(empty, range(0), range(0)).num_rows == 0
+
 
 class TestBuildLocalMetadata:
 
@@ -134,6 +160,100 @@ class TestBuildLocalMetadata:
         assert result["DATA/folder_0/"].num_rows == 2
         assert result["DATA/folder_1/"].num_rows == 2
 
+    def test_groups_interleaved_children(self):
+        level0 = pa.table({
+            METADATA_CURRENT_ID: [0, 1, 2],
+            METADATA_PARENT_ID: [0, 1, 2],
+            "id": ["folder_0", "folder_1", "folder_2"],
+            "type": ["FOLDER", "FOLDER", "FOLDER"],
+        })
+        level1 = pa.table({
+            METADATA_CURRENT_ID: [0, 1, 2, 3],
+            METADATA_PARENT_ID: [1, 0, 1, 0],
+            "id": ["b0", "a0", "b1", "a1"],
+            "type": ["FILE", "FILE", "FILE", "FILE"],
+        })
+
+        result = build_local_metadata([level0, level1])
+
+        assert result["DATA/folder_0/"].column("id").to_pylist() == ["a0", "a1"]
+        assert result["DATA/folder_1/"].column("id").to_pylist() == ["b0", "b1"]
+        assert result["DATA/folder_2/"].num_rows == 0
+
+    def test_sorted_children_are_slices(self):
+        level0 = pa.table({
+            METADATA_CURRENT_ID: [0, 1],
+            METADATA_PARENT_ID: [0, 1],
+            "id": ["folder_0", "folder_1"],
+            "type": ["FOLDER", "FOLDER"],
+        })
+        level1 = pa.table({
+            METADATA_CURRENT_ID: [0, 1, 2],
+            METADATA_PARENT_ID: [0, 0, 1],
+            "id": ["a0", "a1", "b0"],
+            "type": ["FILE", "FILE", "FILE"],
+        })
+
+        result = build_local_metadata([level0, level1])
+
+        children = result["DATA/folder_1/"].column(METADATA_CURRENT_ID).chunk(0)
+        source = level1.column(METADATA_CURRENT_ID).chunk(0)
+        assert children.to_pylist() == [2]
+        assert children.buffers()[1].address == source.buffers()[1].address
+
+
+class TestFolderMask:
+
+    def test_plain_strings(self):
+        types = pa.chunked_array([["FILE", "FOLDER"], ["FOLDER"]])
+        assert folder_mask(types).to_pylist() == [False, True, True]
+
+    def test_dictionary_encoded(self):
+        types = pa.chunked_array([pa.array(["FOLDER", "FILE", "FOLDER"]).dictionary_encode()])
+        assert folder_mask(types).to_pylist() == [True, False, True]
+
+
+class TestReindexMetadataFromSnapshot:
+
+    def _snapshot(self, ds):
+        return ds._duckdb.execute(f"SELECT * FROM {ds._view_name}").fetch_arrow_table()
+
+    def test_drops_orphaned_children(self, nested_a_zip):
+        filtered = nested_a_zip.sql("SELECT * FROM data WHERE cloud_cover < 30")
+        levels, _ = reindex_metadata_from_snapshot(filtered, self._snapshot(filtered))
+
+        assert levels[1].num_rows == 6
+        assert levels[1].column(METADATA_CURRENT_ID).to_pylist() == list(range(6))
+        assert levels[1].column(METADATA_PARENT_ID).to_pylist() == [0, 0, 0, 1, 1, 1]
+
+    def test_concat_keys_by_source(self, nested_a_zip, nested_b_zip):
+        import tacoreader
+
+        concat = tacoreader.concat([nested_a_zip, nested_b_zip])
+        levels, _ = reindex_metadata_from_snapshot(concat, self._snapshot(concat))
+
+        parent_ids = levels[1].column(METADATA_PARENT_ID).to_pylist()
+        assert parent_ids == [i for i in range(10) for _ in range(3)]
+        assert METADATA_SOURCE_PATH not in levels[1].schema.names
+
+
+class TestStripZipColumns:
+
+    def test_projects_out_zip_columns(self, nested_a_zip):
+        levels = strip_zip_columns(nested_a_zip)
+
+        assert [t.num_rows for t in levels] == [5, 15]
+        for table in levels:
+            assert not set(EXPORT_STRIP_COLUMNS) & set(table.schema.names)
+            assert METADATA_CURRENT_ID in table.schema.names
+
+    def test_reuses_level0_snapshot(self, nested_a_zip):
+        snapshot = nested_a_zip._duckdb.execute("SELECT * FROM level0").fetch_arrow_table()
+        levels = strip_zip_columns(nested_a_zip, snapshot)
+
+        assert levels[0].equals(strip_zip_columns(nested_a_zip)[0])
+        assert levels[1].num_rows == 15
+
 
 class TestGetSourceKey:
 
@@ -153,6 +273,22 @@ class TestGetSourceKey:
         assert key == ""
 
 
+class TestSourceKeyArray:
+
+    def test_prefers_source_path(self):
+        table = pa.table({
+            METADATA_SOURCE_PATH: ["/a.zip", None, ""],
+            METADATA_SOURCE_FILE: ["a", "b.zip", "c.zip"],
+        })
+        keys = source_key_array(table)
+        assert keys.to_pylist() == ["/a.zip", "b.zip", "c.zip"]
+
+    def test_empty_for_single_source(self):
+        table = pa.table({"id": ["a", "b"]})
+        keys = source_key_array(table)
+        assert keys.to_pylist() == ["", ""]
+
+
 class TestPrepareCollection:
 
     def test_adds_subset_keys(self, flat_a_zip):
@@ -165,4 +301,10 @@ class TestPrepareCollection:
         filtered = flat_a_zip.sql("SELECT * FROM data WHERE cloud_cover < 30")
         collection = prepare_collection(filtered)
 
-        assert collection["taco:pit_schema"]["root"]["n"] == 3
\ No newline at end of file
+        assert collection["taco:pit_schema"]["root"]["n"] == 3
+    def test_does_not_modify_source_dataset(self, flat_a_zip):
+        filtered = flat_a_zip.sql("SELECT * FROM data WHERE cloud_cover < 30")
+        prepare_collection(filtered)
+
+        assert flat_a_zip.pit_schema.root["n"] == 10
+        assert flat_a_zip.collection["taco:pit_schema"]["root"]["n"] == 10
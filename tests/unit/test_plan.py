@@ -1,48 +1,55 @@
 """Tests for tacobridge.plan module."""
 
+import json
+import shutil
+
 import pytest
 
-from tacobridge.plan import plan_export, plan_zip2folder, plan_folder2zip
+import pyarrow as pa
+import tacoreader
+from tacoreader._exceptions import TacoFormatError
+
+from tacobridge.plan import plan_export, plan_zip2folder, plan_folder2zip, _dest_column, _vsi_copy_columns
 from tacobridge._exceptions import TacoPlanError
-from tacobridge._types import ExportPlan, Zip2FolderPlan, Folder2ZipPlan
+from tacobridge._types import CopyTaskArray, ExportPlan, Zip2FolderPlan, Folder2ZipPlan
 
 
 class TestPlanExport:
 
-    def test_flat_returns_export_plan(self, flat_a_zip, tmp_path):
-        plan = plan_export(flat_a_zip, tmp_path / "out")
+    def test_flat_returns_export_plan(self, flat_export_plan):
+        plan = flat_export_plan
         assert isinstance(plan, ExportPlan)
 
-    def test_flat_task_count(self, flat_a_zip, tmp_path):
-        plan = plan_export(flat_a_zip, tmp_path / "out")
+    def test_flat_task_count(self, flat_export_plan):
+        plan = flat_export_plan
         assert len(plan.tasks) == 10
 
-    def test_flat_single_level(self, flat_a_zip, tmp_path):
-        plan = plan_export(flat_a_zip, tmp_path / "out")
+    def test_flat_single_level(self, flat_export_plan):
+        plan = flat_export_plan
         assert len(plan.levels) == 1
 
-    def test_flat_no_local_metadata(self, flat_a_zip, tmp_path):
-        plan = plan_export(flat_a_zip, tmp_path / "out")
+    def test_flat_no_local_metadata(self, flat_export_plan):
+        plan = flat_export_plan
         assert plan.local_metadata == {}
 
-    def test_nested_task_count(self, nested_a_zip, tmp_path):
-        plan = plan_export(nested_a_zip, tmp_path / "out")
+    def test_nested_task_count(self, nested_export_plan):
+        plan = nested_export_plan
         assert len(plan.tasks) == 15  # 5 folders × 3 children
 
-    def test_nested_two_levels(self, nested_a_zip, tmp_path):
-        plan = plan_export(nested_a_zip, tmp_path / "out")
+    def test_nested_two_levels(self, nested_export_plan):
+        plan = nested_export_plan
         assert len(plan.levels) == 2
 
-    def test_nested_local_metadata(self, nested_a_zip, tmp_path):
-        plan = plan_export(nested_a_zip, tmp_path / "out")
+    def test_nested_local_metadata(self, nested_export_plan):
+        plan = nested_export_plan
         assert len(plan.local_metadata) == 5
 
-    def test_deep_task_count(self, deep_zip, tmp_path):
-        plan = plan_export(deep_zip, tmp_path / "out")
+    def test_deep_task_count(self, deep_export_plan):
+        plan = deep_export_plan
         assert len(plan.tasks) == 12  # 3 × 2 × 2
 
-    def test_deep_three_levels(self, deep_zip, tmp_path):
-        plan = plan_export(deep_zip, tmp_path / "out")
+    def test_deep_three_levels(self, deep_export_plan):
+        plan = deep_export_plan
         assert len(plan.levels) == 3
 
     def test_filtered_fewer_tasks(self, flat_a_zip, tmp_path):
@@ -62,27 +69,47 @@ class TestPlanExport:
         plan = plan_export(filtered, tmp_path / "out")
         assert len(plan.tasks) == 6  # 2 folders × 3 children
 
-    def test_output_exists_raises(self, flat_a_zip, tmp_path):
-        output = tmp_path / "exists"
-        output.mkdir()
-        with pytest.raises(TacoPlanError, match="already exists"):
-            plan_export(flat_a_zip, output)
+    def test_concat_nested_children_match_source(self, nested_a_zip, nested_b_zip, tmp_path):
+        concat = tacoreader.concat([nested_a_zip, nested_b_zip])
+        plan = plan_export(concat, tmp_path / "out")
+        assert len(plan.tasks) == 30
+        assert {task.src for task in plan.tasks} == {str(nested_a_zip._path), str(nested_b_zip._path)}
 
     def test_empty_dataset_raises(self, flat_a_zip, tmp_path):
         empty = flat_a_zip.sql("SELECT * FROM data WHERE cloud_cover > 1000")
         with pytest.raises(TacoPlanError, match="empty"):
             plan_export(empty, tmp_path / "out")
 
-    def test_collection_has_pit_schema(self, flat_a_zip, tmp_path):
-        plan = plan_export(flat_a_zip, tmp_path / "out")
+    def test_collection_has_pit_schema(self, flat_export_plan):
+        plan = flat_export_plan
         assert "taco:pit_schema" in plan.collection
 
-    def test_collection_has_subset_provenance(self, flat_a_zip, tmp_path):
-        plan = plan_export(flat_a_zip, tmp_path / "out")
+    def test_collection_has_subset_provenance(self, flat_export_plan):
+        plan = flat_export_plan
         assert "taco:subset_of" in plan.collection
         assert "taco:subset_date" in plan.collection
 
 
+class TestPlanOutputExists:
+
+    @pytest.mark.parametrize(
+        "planner, source_fixture, output_name",
+        [
+            (plan_export, "flat_a_zip", "exists"),
+            (plan_zip2folder, "flat_a_zip_path", "exists"),
+            (plan_folder2zip, "flat_a_folder", "out.tacozip"),
+        ],
+    )
+    def test_output_exists_raises(self, planner, source_fixture, output_name, request, tmp_path):
+        output = tmp_path / output_name
+        if output.suffix:
+            output.touch()
+        else:
+            output.mkdir()
+        with pytest.raises(TacoPlanError, match="already exists"):
+            planner(request.getfixturevalue(source_fixture), output)
+
+
 class TestPlanZip2Folder:
 
     def test_returns_zip2folder_plan(self, flat_a_zip_path, tmp_path):
@@ -97,18 +124,18 @@ class TestPlanZip2Folder:
         plan = plan_zip2folder(nested_a_zip_path, tmp_path / "out")
         assert len(plan.tasks) == 15
 
+    def test_tasks_are_columnar(self, nested_a_zip_path, tmp_path):
+        plan = plan_zip2folder(nested_a_zip_path, tmp_path / "out")
+        assert isinstance(plan.tasks, CopyTaskArray)
+        assert plan.tasks.table.schema == CopyTaskArray.TASK_SCHEMA
+        assert all(task.offset is not None and task.size is not None for task in plan.tasks)
+
     def test_strips_zip_columns(self, flat_a_zip_path, tmp_path):
         plan = plan_zip2folder(flat_a_zip_path, tmp_path / "out")
         columns = plan.levels[0].schema.names
         assert "__offset__" not in columns
         assert "__size__" not in columns
 
-    def test_output_exists_raises(self, flat_a_zip_path, tmp_path):
-        output = tmp_path / "exists"
-        output.mkdir()
-        with pytest.raises(TacoPlanError, match="already exists"):
-            plan_zip2folder(flat_a_zip_path, output)
-
 
 class TestPlanFolder2Zip:
 
@@ -129,12 +156,87 @@ class TestPlanFolder2Zip:
         for entry in plan.entries:
             assert entry.arc_path.startswith("DATA/")
 
-    def test_output_exists_raises(self, flat_a_folder, tmp_path):
-        output = tmp_path / "out.tacozip"
-        output.touch()
-        with pytest.raises(TacoPlanError, match="already exists"):
-            plan_folder2zip(flat_a_folder, output)
+    def test_nested_arc_paths_match_files(self, nested_a_folder, tmp_path):
+        plan = plan_folder2zip(nested_a_folder, tmp_path / "out.tacozip")
+        for entry in plan.entries:
+            assert not entry.arc_path.endswith("__meta__")
+            assert (nested_a_folder / entry.arc_path).samefile(entry.src)
+
+    def test_symlinked_files_included(self, flat_a_folder, tmp_path):
+        folder = tmp_path / "flat_a"
+        shutil.copytree(flat_a_folder, folder)
+        target = next(p for p in (folder / "DATA").iterdir() if p.is_file() and p.name != "__meta__")
+        moved = target.rename(tmp_path / target.name)
+        target.symlink_to(moved)
+
+        plan = plan_folder2zip(folder, tmp_path / "out.tacozip")
+        assert len(plan.entries) == 10
+        assert f"DATA/{target.name}" in {entry.arc_path for entry in plan.entries}
+
+    def test_collection_with_stdlib_only_json(self, flat_a_folder, tmp_path):
+        folder = tmp_path / "flat_a"
+        shutil.copytree(flat_a_folder, folder)
+        collection_path = folder / "COLLECTION.json"
+        collection = json.loads(collection_path.read_text(encoding="utf-8"))
+        collection["extra"] = {"nan": float("nan"), "big": 2**70}
+        collection_path.write_text(json.dumps(collection, indent=4), encoding="utf-8")
+
+        plan = plan_folder2zip(folder, tmp_path / "out.tacozip")
+        assert plan.collection["extra"]["big"] == 2**70
+
+    def test_invalid_collection_raises(self, flat_a_folder, tmp_path):
+        folder = tmp_path / "flat_a"
+        shutil.copytree(flat_a_folder, folder)
+        (folder / "COLLECTION.json").write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(TacoPlanError, match="Invalid COLLECTION.json"):
+            plan_folder2zip(folder, tmp_path / "out.tacozip")
 
     def test_source_not_found_raises(self, tmp_path):
         with pytest.raises(TacoPlanError, match="not found"):
-            plan_folder2zip(tmp_path / "nope", tmp_path / "out.tacozip")
\ No newline at end of file
+            plan_folder2zip(tmp_path / "nope", tmp_path / "out.tacozip")
+
+
+class TestVsiCopyColumns:
+
+    def test_parses_subfile_and_plain_paths(self):
+        vsi = pa.chunked_array([["/vsisubfile/10_20,/data/a.tacozip", "/data/b.tif"]])
+        src, offset, size = _vsi_copy_columns(vsi)
+
+        assert src.to_pylist() == ["/data/a.tacozip", "/data/b.tif"]
+        assert offset.to_pylist() == [10, None]
+        assert size.to_pylist() == [20, None]
+
+    def test_strips_archive_vsi_prefix(self):
+        vsi = pa.chunked_array([["/vsisubfile/0_5,/vsicurl/https://host/a.tacozip"] * 2])
+        src, _, _ = _vsi_copy_columns(vsi)
+
+        assert src.to_pylist() == ["https://host/a.tacozip"] * 2
+
+    def test_malformed_subfile_raises(self):
+        vsi = pa.chunked_array([["/vsisubfile/10,/data/a.tacozip"]])
+        with pytest.raises(TacoFormatError):
+            _vsi_copy_columns(vsi)
+
+    def test_irregular_subfile_parsed_like_tacoreader(self):
+        vsi = pa.chunked_array(
+            [["/vsisubfile/10_20,/data/a.tacozip"], ["/vsisubfile/+12_ 5,/data/b.tacozip", "/c.tif"]]
+        )
+        src, offset, size = _vsi_copy_columns(vsi)
+
+        assert src.to_pylist() == ["/data/a.tacozip", "/data/b.tacozip", "/c.tif"]
+        assert offset.to_pylist() == [10, 12, None]
+        assert size.to_pylist() == [20, 5, None]
+
+    def test_mixed_valid_and_malformed_raises(self):
+        vsi = pa.chunked_array([["/vsisubfile/10_20,/data/a.tacozip", "/vsisubfile/x_20,/data/b.tacozip"]])
+        with pytest.raises(TacoFormatError, match="not integers"):
+            _vsi_copy_columns(vsi)
+
+
+class TestDestColumn:
+
+    def test_matches_path_join(self, tmp_path):
+        names = pa.chunked_array([["a", "b/c"], ["/abs", "x//y", "./z", "t/", "", "..hidden"]])
+        dests = _dest_column(tmp_path / "DATA", names).to_pylist()
+        assert dests == [str(tmp_path / "DATA" / name) for name in names.to_pylist()]
@@ -1,5 +1,7 @@
 """Tests for tacobridge._types module."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pathlib import Path
 
@@ -7,6 +9,7 @@ import pyarrow as pa
 
 from tacobridge._types import (
     CopyTask,
+    CopyTaskArray,
     ZipEntry,
     ExportPlan,
     Zip2FolderPlan,
@@ -30,7 +33,7 @@ class TestCopyTask:
 
     def test_frozen(self):
         task = CopyTask(src="/a", dest="/b")
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             task.src = "/c"
 
     def test_hashable(self):
@@ -39,6 +42,56 @@ class TestCopyTask:
         assert {task}  # can be in set
 
 
+class TestCopyTaskArray:
+
+    def _tasks(self):
+        return [
+            CopyTask(src="/a.zip", dest="/out/DATA/a", offset=10, size=5),
+            CopyTask(src="/b.tif", dest="/out/DATA/b"),
+            CopyTask(src="/a.zip", dest="/out/DATA/c", offset=20, size=7),
+        ]
+
+    def test_roundtrip(self):
+        tasks = self._tasks()
+        array = CopyTaskArray.from_tasks(tasks)
+        assert len(array) == 3
+        assert list(array) == tasks
+        assert array == tasks
+
+    def test_indexing(self):
+        array = CopyTaskArray.from_tasks(self._tasks())
+        assert array[1] == CopyTask(src="/b.tif", dest="/out/DATA/b")
+        assert array[-1].offset == 20
+        with pytest.raises(IndexError):
+            array[3]
+
+    def test_slice_is_array(self):
+        array = CopyTaskArray.from_tasks(self._tasks())
+        part = array[1:]
+        assert isinstance(part, CopyTaskArray)
+        assert [t.dest for t in part] == ["/out/DATA/b", "/out/DATA/c"]
+
+    def test_with_dest_root(self):
+        array = CopyTaskArray.from_tasks(self._tasks())
+        moved = array.with_dest_root(Path("/out"), Path("/tmp/.out_temp"))
+        assert [t.dest for t in moved] == [
+            "/tmp/.out_temp/DATA/a",
+            "/tmp/.out_temp/DATA/b",
+            "/tmp/.out_temp/DATA/c",
+        ]
+        assert [t.src for t in moved] == [t.src for t in array]
+
+    def test_with_dest_root_outside_raises(self):
+        array = CopyTaskArray.from_tasks(self._tasks())
+        with pytest.raises(ValueError):
+            array.with_dest_root(Path("/elsewhere"), Path("/tmp"))
+
+    def test_with_dest_root_sibling_prefix_raises(self):
+        array = CopyTaskArray.from_tasks([CopyTask(src="/a.tif", dest="/out/ds2/DATA/x")])
+        with pytest.raises(ValueError):
+            array.with_dest_root(Path("/out/ds"), Path("/tmp"))
+
+
 class TestZipEntry:
 
     def test_create(self):
@@ -48,7 +101,7 @@ class TestZipEntry:
 
     def test_frozen(self):
         entry = ZipEntry(src="/a", arc_path="b")
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             entry.arc_path = "c"
 
 
@@ -77,7 +130,7 @@ class TestExportPlan:
 
     def test_frozen(self):
         plan = ExportPlan(tasks=(), source="/src", output=Path("/out"))
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             plan.source = "/new"
 
 
@@ -93,7 +146,7 @@ class TestZip2FolderPlan:
 
     def test_frozen(self):
         plan = Zip2FolderPlan(tasks=(), source="/src", output=Path("/out"))
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             plan.output = Path("/new")
 
 
@@ -118,5 +171,5 @@ class TestFolder2ZipPlan:
 
     def test_frozen(self):
         plan = Folder2ZipPlan(entries=(), source=Path("/src"), output=Path("/out"))
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             plan.entries = ()
\ No newline at end of file